@@ -6,12 +6,22 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-
-from .const import DOMAIN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_BUTTON_LIGHTS,
+    CONF_BUTTON_SENSORS,
+    CONF_FADER_LIGHTS,
+    CONF_VOLUME_PLAYERS,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
 from .helper import CannotConnect
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +32,23 @@ PLATFORMS: list[Platform] = [
     Platform.SENSOR,
 ]
 
+# Entity groups of the platforms only set up when one of them is turned on
+GROUP_PLATFORMS: dict[Platform, tuple[str, ...]] = {
+    Platform.BINARY_SENSOR: (CONF_BUTTON_SENSORS,),
+    Platform.LIGHT: (CONF_BUTTON_LIGHTS, CONF_FADER_LIGHTS),
+    Platform.MEDIA_PLAYER: (CONF_VOLUME_PLAYERS,),
+}
+
+
+def get_platforms(entity_groups: set[str]) -> list[Platform]:
+    """Get the platforms with entities in the groups turned on."""
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform not in GROUP_PLATFORMS
+        or not entity_groups.isdisjoint(GROUP_PLATFORMS[platform])
+    ]
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,17 +61,32 @@ async def async_setup_entry(
         entry=entry,
     )
 
+    await coordinator.async_load_snapshot()
+
+    # With a last known mixer, setup connects in the background instead
     try:
         await coordinator.setup()
     except (asyncio.TimeoutError, CannotConnect) as exception:
+        await coordinator.cleanup()
         raise ConfigEntryNotReady(exception) from exception
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        # Release the shared connection, the retry gets a new coordinator
+        await coordinator.cleanup()
+        raise
+
+    await _async_migrate_unique_ids(hass, entry, coordinator)
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    platforms = get_platforms(coordinator.entity_groups)
+    _async_remove_platform_entities(hass, entry, platforms)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    async_setup_services(hass)
 
     # Reload entry when its updated.
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -57,10 +99,10 @@ async def async_unload_entry(
     entry: ConfigEntry,
 ) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][
-            entry.entry_id
-        ]
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, get_platforms(coordinator.entity_groups)
+    ):
         await coordinator.cleanup()
 
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -68,6 +110,50 @@ async def async_unload_entry(
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the last known mixer of a removed config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload the config entry when it changed."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_migrate_unique_ids(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
+) -> None:
+    """Migrate unique ids shared by all mixers of a model to per mixer ones."""
+    usb_device = coordinator.data.hardware.usb_device
+    old_prefix = f"{usb_device.manufacturer_name}_{usb_device.product_name}_".lower()
+    new_prefix = f"{coordinator.device_context.unique_id_prefix}_"
+
+    @callback
+    def _async_migrate_unique_id(
+        entity_entry: er.RegistryEntry,
+    ) -> dict[str, str] | None:
+        """Migrate the unique id of an entity."""
+        if not entity_entry.unique_id.startswith(old_prefix):
+            return None
+        return {
+            "new_unique_id": entity_entry.unique_id.replace(old_prefix, new_prefix, 1)
+        }
+
+    await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_unique_id)
+
+
+@callback
+def _async_remove_platform_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    platforms: list[Platform],
+) -> None:
+    """Remove the entities of the platforms that are not set up."""
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        if entity_entry.domain not in platforms:
+            entity_registry.async_remove(entity_entry.entity_id)
@@ -1,32 +1,50 @@
 """Support for GoXLR Utility binary sensors."""
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from operator import attrgetter
 
 from goxlrutilityapi.const import NAME_MAP
 from goxlrutilityapi.models.map_item import MapItem
+from goxlrutilityapi.models.status import ButtonDown
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.binary_sensor import (
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import CONF_BINARY_SENSOR_WRITE_INTERVAL, CONF_BUTTON_SENSORS, DOMAIN
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
-from .entity import GoXLRUtilityBinarySensorEntityDescription, GoXLRUtilityEntity
+from .entity import (
+    GoXLRUtilityEntity,
+    GoXLRUtilityEntityDescription,
+    async_get_enabled_descriptions,
+)
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up GoXLR Utility sensor based on a config entry."""
-    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+@dataclass
+class GoXLRUtilityBinarySensorEntityDescription(
+    GoXLRUtilityEntityDescription, BinarySensorEntityDescription
+):
+    """Class describing GoXLR Utility binary sensor entities."""
+
+    value: Callable = round
+    item_key: str | None = None
+
 
+@cache
+def get_binary_sensor_descriptions() -> (
+    tuple[GoXLRUtilityBinarySensorEntityDescription, ...]
+):
+    """Get the binary sensor descriptions, shared by all mixers."""
     binary_sensor_descriptions = []
-    for key in vars(coordinator.data.button_down):
+    for key in ButtonDown.__fields__:
         map_item: MapItem | None = NAME_MAP.get(key)
         binary_sensor_descriptions.append(
             GoXLRUtilityBinarySensorEntityDescription(
@@ -34,44 +52,38 @@ async def async_setup_entry(
                 name=f"{map_item.name if map_item else key} pressed",
                 icon=map_item.icon if map_item else "mdi:button-pointer",
                 entity_category=EntityCategory.DIAGNOSTIC,
-                value=lambda data, item_key=key: data.button_down.__dict__.get(
-                    item_key, None
-                ),
+                paths=(("button_down", key),),
+                group=CONF_BUTTON_SENSORS,
+                value=attrgetter(f"button_down.{key}"),
             )
         )
+    return tuple(binary_sensor_descriptions)
 
-    entities = []
-    for description in binary_sensor_descriptions:
-        entities.append(
-            GoXLRUtilitySensor(
-                coordinator,
-                description,
-                entry.data.copy(),
-            )
-        )
 
-    async_add_entities(entities)
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up GoXLR Utility sensor based on a config entry."""
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        GoXLRUtilitySensor(coordinator, description)
+        for description in async_get_enabled_descriptions(
+            hass,
+            coordinator,
+            Platform.BINARY_SENSOR,
+            get_binary_sensor_descriptions(),
+        )
+    )
 
 
 class GoXLRUtilitySensor(GoXLRUtilityEntity, BinarySensorEntity):
     """Define a GoXLR Utility sensor."""
 
     entity_description: GoXLRUtilityBinarySensorEntityDescription
-
-    def __init__(
-        self,
-        coordinator: GoXLRUtilityDataUpdateCoordinator,
-        description: GoXLRUtilityBinarySensorEntityDescription,
-        entry_data: dict[str, Any],
-    ) -> None:
-        """Initialize."""
-        super().__init__(
-            coordinator,
-            entry_data,
-            description.key,
-            description.name,
-        )
-        self.entity_description = description
+    _write_interval_option = CONF_BINARY_SENSOR_WRITE_INTERVAL
 
     @property
     def is_on(self) -> bool | None:
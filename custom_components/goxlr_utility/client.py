@@ -0,0 +1,101 @@
+"""Websocket client for GoXLR Utility integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import async_timeout
+from goxlrutilityapi.const import (
+    KEY_DATA,
+    KEY_ID,
+    REQUEST_TYPE_COMMAND,
+    REQUEST_TYPE_PING,
+    RESPONSE_TYPE_ERROR,
+    RESPONSE_TYPE_OK,
+)
+from goxlrutilityapi.exceptions import BadMessageException, ConnectionClosedException
+from goxlrutilityapi.models.request import Request
+from goxlrutilityapi.websocket_client import WebsocketClient
+
+from .const import COMMAND_TIMEOUT
+
+
+class GoXLRUtilityClient(WebsocketClient):
+    """Websocket client that matches command replies to their requests.
+
+    The library sends commands without waiting for their replies, which it
+    cannot match as they are not models. This client keeps the commands in
+    flight by message id and completes them when their reply arrives, so
+    any number of commands can be outstanding on the one connection. Pings
+    are answered the same way, which makes them cheap round trip probes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        super().__init__()
+        self._pending_replies: dict[int, asyncio.Future[None]] = {}
+
+    @property
+    def commands_in_flight(self) -> int:
+        """Return the number of commands and pings waiting for their reply."""
+        return len(self._pending_replies)
+
+    async def send_command(self, serial: str, command: dict[str, Any]) -> None:
+        """Send a command to a mixer and wait for the daemon to accept it."""
+        await self._send_request({REQUEST_TYPE_COMMAND: [serial, command]})
+
+    async def ping(self) -> None:
+        """Send a request the daemon only replies to and wait for the reply."""
+        await self._send_request(REQUEST_TYPE_PING)
+
+    async def _send_request(self, data: str | dict[str, Any]) -> None:
+        """Send a request and wait for the daemon to reply with Ok."""
+        if not self.connected or self._websocket is None:
+            raise ConnectionClosedException("Connection is closed")
+
+        # Shares the message ids of the library's own requests
+        self._current_id += 1
+        request = Request(id=self._current_id, data=data)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending_replies[request.id] = future
+        try:
+            await self._websocket.send_str(request.json())
+            async with async_timeout.timeout(COMMAND_TIMEOUT):
+                await future
+        finally:
+            self._pending_replies.pop(request.id, None)
+
+    async def _listen_for_messages(
+        self,
+        callback: Callable[[dict[Any, Any]], Awaitable[None]],
+    ) -> None:
+        """Listen for messages, completing commands from their replies."""
+
+        async def _message_callback(message: dict[Any, Any]) -> None:
+            """Complete a pending command or pass the message on."""
+            if (future := self._pending_replies.get(message.get(KEY_ID))) is None:
+                await callback(message)
+                return
+            if future.done():
+                return
+
+            data = message.get(KEY_DATA)
+            if data == RESPONSE_TYPE_OK:
+                future.set_result(None)
+            elif isinstance(data, dict) and RESPONSE_TYPE_ERROR in data:
+                future.set_exception(
+                    BadMessageException(f"Request failed: {data[RESPONSE_TYPE_ERROR]}")
+                )
+            else:
+                future.set_exception(BadMessageException(f"Unexpected reply: {data}"))
+
+        try:
+            await super()._listen_for_messages(_message_callback)
+        finally:
+            # Replies can not arrive once the connection is gone
+            for future in self._pending_replies.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionClosedException("Connection is closed")
+                    )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import suppress
 import logging
 from typing import Any
 
@@ -12,10 +13,28 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResult
-
-from .const import CONNECTION_ERRORS, DOMAIN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.data_entry_flow import AbortFlow, FlowResult
+
+from .connection import GoXLRUtilityHandoff, async_park_handoff
+from .const import (
+    CONF_LATENCY_PROBE,
+    CONF_OPTIMISTIC,
+    CONF_PATCH_BATCH_WINDOW,
+    CONF_PATCH_OVERFLOW_POLICY,
+    CONNECTION_ERRORS,
+    DEFAULT_ENTITY_GROUPS,
+    DEFAULT_LATENCY_PROBE,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PATCH_BATCH_WINDOW,
+    DEFAULT_PATCH_OVERFLOW_POLICY,
+    DEFAULT_WRITE_INTERVALS,
+    DOMAIN,
+    MAX_PATCH_BATCH_WINDOW,
+    MAX_WRITE_INTERVAL,
+    PATCH_OVERFLOW_BLOCK,
+    PATCH_OVERFLOW_RESYNC,
+)
 from .helper import CannotConnect, setup_connection
 
 _LOGGER = logging.getLogger(__name__)
@@ -46,8 +65,13 @@ async def listen_for_patches(
 async def validate_input(
     hass: HomeAssistant,
     data: dict[str, Any],
+    configured_serials: set[str | None],
 ) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+    """Validate the user input allows us to connect.
+
+    A daemon can drive several mixers, the first one not configured yet
+    is picked.
+    """
     websocket_client = await setup_connection(hass, data)
 
     listener_task = hass.async_create_background_task(
@@ -55,17 +79,39 @@ async def validate_input(
         name="GoXLR Utility Patch Listener",
     )
 
-    status = await websocket_client.get_status()
-    mixer = get_mixer_from_status(status)
-    if mixer is None:
-        raise CannotConnect("No mixer found")
-
-    listener_task.cancel()
-    await websocket_client.disconnect()
+    try:
+        status = await websocket_client.get_status()
+        mixer = next(
+            (
+                mixer
+                for serial, mixer in status.mixers.items()
+                if serial not in configured_serials
+            ),
+            get_mixer_from_status(status),
+        )
+        if mixer is None:
+            raise CannotConnect("No mixer found")
+
+        # Patches received from now on wait in the socket for the next reader,
+        # the ones read since the status reply are lost until the coordinator
+        # resyncs after taking over the connection
+        listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener_task
+    except BaseException:
+        listener_task.cancel()
+        await websocket_client.disconnect()
+        raise
 
     return {
         "title": f"{mixer.hardware.usb_device.manufacturer_name} - {mixer.hardware.usb_device.product_name}",
         "identifier": mixer.hardware.serial_number,
+        "handoff": GoXLRUtilityHandoff(
+            host=data[CONF_HOST],
+            port=data[CONF_PORT],
+            client=websocket_client,
+            mixer=mixer,
+        ),
     }
 
 
@@ -74,6 +120,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
@@ -82,14 +136,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
+                info = await validate_input(
+                    self.hass,
+                    user_input,
+                    self._async_current_ids(),
+                )
             except (asyncio.TimeoutError, CannotConnect):
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                handoff: GoXLRUtilityHandoff = info["handoff"]
                 await self.async_set_unique_id(info["identifier"])
+                try:
+                    self._abort_if_unique_id_configured()
+                except AbortFlow:
+                    await handoff.client.disconnect()
+                    raise
+                # Let the first setup continue with the connection and mixer
+                await async_park_handoff(self.hass, info["identifier"], handoff)
                 return self.async_create_entry(
                     title=info["title"],
                     data=user_input,
@@ -100,3 +166,69 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle GoXLR Utility options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, Any] | None = None,
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            # Keep the options this form does not show
+            return self.async_create_entry(
+                title="",
+                data={**self.config_entry.options, **user_input},
+            )
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    **{
+                        vol.Required(group, default=options.get(group, default)): bool
+                        for group, default in DEFAULT_ENTITY_GROUPS.items()
+                    },
+                    **{
+                        vol.Required(
+                            option,
+                            default=options.get(option, default),
+                        ): vol.All(
+                            vol.Coerce(float),
+                            vol.Range(min=0, max=MAX_WRITE_INTERVAL),
+                        )
+                        for option, default in DEFAULT_WRITE_INTERVALS.items()
+                    },
+                    vol.Required(
+                        CONF_OPTIMISTIC,
+                        default=options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC),
+                    ): bool,
+                    vol.Required(
+                        CONF_PATCH_BATCH_WINDOW,
+                        default=options.get(
+                            CONF_PATCH_BATCH_WINDOW, DEFAULT_PATCH_BATCH_WINDOW
+                        ),
+                    ): vol.All(
+                        vol.Coerce(float),
+                        vol.Range(min=0, max=MAX_PATCH_BATCH_WINDOW),
+                    ),
+                    vol.Required(
+                        CONF_PATCH_OVERFLOW_POLICY,
+                        default=options.get(
+                            CONF_PATCH_OVERFLOW_POLICY, DEFAULT_PATCH_OVERFLOW_POLICY
+                        ),
+                    ): vol.In([PATCH_OVERFLOW_RESYNC, PATCH_OVERFLOW_BLOCK]),
+                    vol.Required(
+                        CONF_LATENCY_PROBE,
+                        default=options.get(CONF_LATENCY_PROBE, DEFAULT_LATENCY_PROBE),
+                    ): bool,
+                }
+            ),
+        )
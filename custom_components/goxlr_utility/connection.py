@@ -0,0 +1,348 @@
+"""Shared connection to a GoXLR Utility daemon for GoXLR Utility integration."""
+from __future__ import annotations
+
+import asyncio
+from asyncio import Lock, Task
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from goxlrutilityapi.exceptions import (
+    BadMessageException,
+    ConnectionClosedException,
+    ConnectionErrorException,
+)
+from goxlrutilityapi.models.patch import Patch
+from goxlrutilityapi.models.response import Response
+from goxlrutilityapi.models.status import Mixer, Status
+
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.event import async_call_later
+
+from .client import GoXLRUtilityClient
+from .const import (
+    CONNECTION_ERRORS,
+    DATA_CONNECTIONS,
+    DATA_HANDOFFS,
+    DOMAIN,
+    HANDOFF_TIMEOUT,
+    RECONNECT_BASE_DELAY,
+    RECONNECT_MAX_DELAY,
+)
+from .helper import CannotConnect, setup_connection
+from .metrics import ReconnectStatistics
+
+if TYPE_CHECKING:
+    from .coordinator import GoXLRUtilityDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class GoXLRUtilityHandoff:
+    """Connected client and mixer left by the config flow for the first setup."""
+
+    host: str
+    port: int
+    client: GoXLRUtilityClient
+    mixer: Mixer
+    # Cancels disconnecting the client if no setup claims it in time
+    cancel_expiry: CALLBACK_TYPE | None = None
+
+
+class GoXLRUtilityConnection:
+    """Websocket connection to a GoXLR Utility daemon, shared by its mixers.
+
+    The daemon reports every connected mixer in one status and one patch
+    stream, so each host needs one connection, one status fetch and one
+    listener, fanned out to the coordinators by mixer serial number.
+    """
+
+    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+        """Initialize the connection."""
+        self._connect_lock = Lock()
+        self._listener_task: Task | None = None
+        self._reconnect_task: Task | None = None
+        self._shutdown = False
+        self._status_task: Task[Status] | None = None
+        self.client: GoXLRUtilityClient | None = None
+        # Coordinators of the mixers on this daemon by serial number
+        self.coordinators: dict[str, GoXLRUtilityDataUpdateCoordinator] = {}
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.reconnect_statistics = ReconnectStatistics()
+
+    @property
+    def connected(self) -> bool:
+        """Return if the connection is up and listening."""
+        return (
+            self.client is not None
+            and self.client.connected
+            and self._listener_task is not None
+            and not self._listener_task.done()
+        )
+
+    async def async_connect(self, client: GoXLRUtilityClient | None = None) -> None:
+        """Connect and start listening, unless already connected.
+
+        A connected client, such as the one of the config flow, is adopted
+        instead of opening a new connection.
+        """
+        async with self._connect_lock:
+            if self.connected:
+                if client is not None:
+                    await client.disconnect()
+                return
+
+            if self.client is not None:
+                await self.client.disconnect()
+            if client is not None and client.connected:
+                self.client = client
+            else:
+                self.client = await setup_connection(
+                    self.hass,
+                    {CONF_HOST: self.host, CONF_PORT: self.port},
+                )
+            self._listener_task = self.hass.async_create_background_task(
+                self._listen(self.client),
+                name="GoXLR Utility Patch Listener",
+            )
+
+    async def _listen(self, client: GoXLRUtilityClient) -> None:
+        """Listen for patches from GoXLR Utility."""
+        try:
+            await client.listen(self._patch_callback)
+        except (ConnectionClosedException, ConnectionResetError) as exception:
+            _LOGGER.debug(
+                "Websocket connection closed for %s. Will retry: %s",
+                self.host,
+                exception,
+            )
+        except ConnectionErrorException as exception:
+            _LOGGER.debug(
+                "Connection error occurred for %s. Will retry: %s",
+                self.host,
+                exception,
+            )
+        except BadMessageException as exception:
+            _LOGGER.warning(
+                "Bad message received for %s. Will retry: %s",
+                self.host,
+                exception,
+            )
+        else:
+            _LOGGER.debug("Websocket connection ended for %s", self.host)
+
+        self._async_connection_lost()
+
+    async def _patch_callback(self, response: Response[Patch]) -> None:
+        """Pass a patch to the coordinator of its mixer."""
+        # Mixer patch paths start with /mixers/<serial>/
+        paths = response.data.path.split("/", 3)
+        if len(paths) < 3 or paths[1] != "mixers":
+            return
+        if (coordinator := self.coordinators.get(paths[2])) is not None:
+            await coordinator.patch_callback(response)
+
+    @callback
+    def _async_connection_lost(self) -> None:
+        """Handle a lost connection to GoXLR Utility."""
+        if self._shutdown:
+            return
+
+        for coordinator in self.coordinators.values():
+            coordinator.async_connection_lost()
+
+        self.async_reconnect()
+
+    @callback
+    def async_reconnect(self) -> None:
+        """Reconnect in the background, unless already reconnecting."""
+        if self._shutdown:
+            return
+
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.hass.async_create_background_task(
+                self._reconnect(),
+                name="GoXLR Utility Reconnect",
+            )
+
+    async def _reconnect(self) -> None:
+        """Reconnect to GoXLR Utility with exponential backoff and jitter."""
+        started = time.monotonic()
+        attempt = 0
+        while not self._shutdown:
+            attempt += 1
+            self.reconnect_statistics.attempts += 1
+            try:
+                await self.async_connect()
+                status = await self.async_get_status()
+                if not self.connected:
+                    raise ConnectionClosedException("Connection lost during reconnect")
+            except (
+                asyncio.TimeoutError,
+                BadMessageException,
+                CannotConnect,
+                *CONNECTION_ERRORS,
+            ) as exception:
+                delay = min(
+                    RECONNECT_MAX_DELAY,
+                    RECONNECT_BASE_DELAY * 2 ** (attempt - 1),
+                )
+                delay = random.uniform(delay / 2, delay)
+                _LOGGER.debug(
+                    "Reconnect attempt %s for %s failed, retrying in %.1fs: %s",
+                    attempt,
+                    self.host,
+                    delay,
+                    exception,
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            recovery_time = time.monotonic() - started
+            self.reconnect_statistics.record(attempt, recovery_time)
+            _LOGGER.info(
+                "Reconnected to %s after %s attempts in %.1fs",
+                self.host,
+                attempt,
+                recovery_time,
+            )
+            for serial, coordinator in self.coordinators.items():
+                # Mixers unplugged meanwhile stay unavailable
+                if (mixer := status.mixers.get(serial)) is not None:
+                    coordinator.async_resync(mixer)
+            return
+
+    async def async_get_status(self) -> Status:
+        """Get the status, sharing one request between concurrent callers."""
+        if self._status_task is None or self._status_task.done():
+            self._status_task = self.hass.async_create_background_task(
+                self._get_status(),
+                name="GoXLR Utility Status",
+            )
+        return await asyncio.shield(self._status_task)
+
+    async def _get_status(self) -> Status:
+        """Get the status from GoXLR Utility."""
+        if self.client is None or not self.client.connected:
+            raise ConnectionClosedException("Websocket not connected")
+        return await self.client.get_status()
+
+    async def async_get_mixer(self, serial: str) -> Mixer:
+        """Get a mixer from GoXLR Utility."""
+        if not self.connected:
+            raise ConfigEntryNotReady("Websocket not connected")
+
+        status = await self.async_get_status()
+        if (mixer := status.mixers.get(serial)) is None:
+            raise ConfigEntryNotReady(f"Mixer {serial} not found")
+        return mixer
+
+    async def disconnect(self) -> None:
+        """Stop listening and disconnect."""
+        self._shutdown = True
+        for task in (self._listener_task, self._reconnect_task, self._status_task):
+            if task is not None:
+                task.cancel()
+        self._listener_task = None
+        self._reconnect_task = None
+        self._status_task = None
+
+        if self.client is not None:
+            await self.client.disconnect()
+
+
+@callback
+def async_acquire_connection(
+    hass: HomeAssistant,
+    host: str,
+    port: int,
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
+) -> GoXLRUtilityConnection:
+    """Get the shared connection to a daemon and add a mixer's coordinator."""
+    connections: dict[tuple[str, int], GoXLRUtilityConnection] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_CONNECTIONS, {})
+    if (connection := connections.get((host, port))) is None:
+        connection = connections[(host, port)] = GoXLRUtilityConnection(
+            hass, host, port
+        )
+    connection.coordinators[coordinator.serial] = coordinator
+    return connection
+
+
+async def async_release_connection(
+    hass: HomeAssistant,
+    connection: GoXLRUtilityConnection,
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
+) -> None:
+    """Remove a mixer's coordinator, disconnecting after the last one."""
+    if connection.coordinators.get(coordinator.serial) is coordinator:
+        del connection.coordinators[coordinator.serial]
+    if connection.coordinators:
+        return
+
+    connections: dict[tuple[str, int], GoXLRUtilityConnection] = hass.data[DOMAIN][
+        DATA_CONNECTIONS
+    ]
+    if connections.get((connection.host, connection.port)) is connection:
+        del connections[(connection.host, connection.port)]
+    await connection.disconnect()
+
+
+async def async_park_handoff(
+    hass: HomeAssistant,
+    serial: str,
+    handoff: GoXLRUtilityHandoff,
+) -> None:
+    """Keep the config flow's client and mixer for the first setup of a mixer.
+
+    The client is disconnected if no setup claims it in time, such as when
+    the setup of the new entry fails before getting to it.
+    """
+    handoffs: dict[str, GoXLRUtilityHandoff] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DATA_HANDOFFS, {})
+    if (stale := handoffs.pop(serial, None)) is not None:
+        if stale.cancel_expiry is not None:
+            stale.cancel_expiry()
+        await stale.client.disconnect()
+
+    async def _async_expire(_: datetime) -> None:
+        """Disconnect the client of the handoff unless it was claimed."""
+        if handoffs.get(serial) is not handoff:
+            return
+        del handoffs[serial]
+        _LOGGER.debug("Disconnecting the unclaimed connection of %s", serial)
+        await handoff.client.disconnect()
+
+    handoff.cancel_expiry = async_call_later(hass, HANDOFF_TIMEOUT, _async_expire)
+    handoffs[serial] = handoff
+
+
+async def async_claim_handoff(
+    hass: HomeAssistant,
+    serial: str,
+    host: str,
+    port: int,
+) -> GoXLRUtilityHandoff | None:
+    """Take the config flow's client and mixer if they are still fresh."""
+    handoffs: dict[str, GoXLRUtilityHandoff] = hass.data.get(DOMAIN, {}).get(
+        DATA_HANDOFFS, {}
+    )
+    if (handoff := handoffs.pop(serial, None)) is None:
+        return None
+    if handoff.cancel_expiry is not None:
+        handoff.cancel_expiry()
+        handoff.cancel_expiry = None
+    if (handoff.host, handoff.port) != (host, port) or not handoff.client.connected:
+        await handoff.client.disconnect()
+        return None
+    return handoff
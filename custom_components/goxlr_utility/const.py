@@ -8,8 +8,158 @@ from goxlrutilityapi.exceptions import (
 
 DOMAIN: Final[str] = "goxlr_utility"
 
+# Key of the shared daemon connections by host and port in the domain data
+DATA_CONNECTIONS: Final[str] = "connections"
+# Key of the connections and mixers left by the config flow by serial number
+DATA_HANDOFFS: Final[str] = "handoffs"
+
 CONNECTION_ERRORS: Final = (
     ConnectionClosedException,
     ConnectionErrorException,
     ConnectionResetError,
 )
+
+CONF_BINARY_SENSOR_WRITE_INTERVAL: Final[str] = "binary_sensor_write_interval"
+CONF_BUTTON_LIGHTS: Final[str] = "button_lights"
+CONF_BUTTON_SENSORS: Final[str] = "button_sensors"
+CONF_DIAGNOSTICS: Final[str] = "diagnostics"
+CONF_FADER_LIGHTS: Final[str] = "fader_lights"
+CONF_LATENCY_PROBE: Final[str] = "latency_probe"
+CONF_LIGHT_WRITE_INTERVAL: Final[str] = "light_write_interval"
+CONF_MEDIA_PLAYER_WRITE_INTERVAL: Final[str] = "media_player_write_interval"
+CONF_OPTIMISTIC: Final[str] = "optimistic"
+CONF_PATCH_BATCH_WINDOW: Final[str] = "patch_batch_window"
+CONF_PATCH_OVERFLOW_POLICY: Final[str] = "patch_overflow_policy"
+CONF_ROUTING: Final[str] = "routing"
+CONF_VOLUME_PLAYERS: Final[str] = "volume_players"
+
+# Whether the entities of a group are created by the option turning it on
+DEFAULT_ENTITY_GROUPS: Final[dict[str, bool]] = {
+    CONF_VOLUME_PLAYERS: True,
+    CONF_BUTTON_LIGHTS: True,
+    CONF_FADER_LIGHTS: True,
+    CONF_BUTTON_SENSORS: True,
+    CONF_ROUTING: True,
+    CONF_DIAGNOSTICS: True,
+}
+
+# Seconds to collect incoming patches before applying them as one batch
+DEFAULT_PATCH_BATCH_WINDOW: Final[float] = 0.005
+MAX_PATCH_BATCH_WINDOW: Final[float] = 0.5
+
+# Maximum number of patches waiting to be applied
+PATCH_QUEUE_SIZE: Final[int] = 1024
+
+# What to do when the patch queue is full
+PATCH_OVERFLOW_BLOCK: Final[str] = "block"
+PATCH_OVERFLOW_RESYNC: Final[str] = "resync"
+DEFAULT_PATCH_OVERFLOW_POLICY: Final[str] = PATCH_OVERFLOW_RESYNC
+
+# Upper bounds of the batch size histogram buckets, the last bucket is open
+PATCH_BATCH_SIZE_BUCKETS: Final[tuple[int, ...]] = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Seconds to wait between reconnect attempts, doubled after each failed attempt
+RECONNECT_BASE_DELAY: Final[float] = 0.5
+RECONNECT_MAX_DELAY: Final[float] = 60.0
+
+# Seconds the config flow's connection and mixer stay fresh for the first setup
+HANDOFF_TIMEOUT: Final[float] = 30.0
+
+# Command routing an input to an output, not defined by goxlrutilityapi
+COMMAND_TYPE_SET_ROUTER: Final[str] = "SetRouter"
+
+# Seconds to wait for the daemon to reply to a command
+COMMAND_TIMEOUT: Final[float] = 10.0
+
+# Show the values of sent commands before the device confirms them
+DEFAULT_OPTIMISTIC: Final[bool] = True
+
+# Seconds to wait for the device to confirm a value before rolling it back
+OPTIMISTIC_TIMEOUT: Final[float] = 2.0
+
+# Minimum seconds between state writes of an entity by option, changes
+# inside the interval are written together when it ends
+DEFAULT_WRITE_INTERVALS: Final[dict[str, float]] = {
+    CONF_BINARY_SENSOR_WRITE_INTERVAL: 0.1,
+    CONF_LIGHT_WRITE_INTERVAL: 0.0,
+    CONF_MEDIA_PLAYER_WRITE_INTERVAL: 0.1,
+}
+MAX_WRITE_INTERVAL: Final[float] = 10.0
+
+# Whether the round trip time to the daemon is probed with pings
+DEFAULT_LATENCY_PROBE: Final[bool] = False
+
+# Seconds between pings while patches or commands are flowing, doubled for
+# every ping without any in between up to the maximum
+LATENCY_PROBE_INTERVAL: Final[float] = 30.0
+LATENCY_PROBE_MAX_INTERVAL: Final[float] = 480.0
+
+# Seconds a dropped connection may take to recover before entities become unavailable
+UNAVAILABLE_GRACE_PERIOD: Final[float] = 5.0
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+)
+
+# Seconds of history used to calculate rates
+RATE_WINDOW: Final[int] = 10
+
+# Number of recent values the rolling percentiles are calculated from
+ROLLING_PERCENTILE_SIZE: Final[int] = 100
+
+# Seconds between updates of the metric sensors
+METRICS_UPDATE_INTERVAL: Final[int] = 30
+
+# Number of recent patches kept for diagnostics
+RECENT_PATCHES_SIZE: Final[int] = 100
+
+# Storage of the last known mixer, shown until the daemon is connected
+STORAGE_VERSION: Final[int] = 1
+# Seconds to wait before saving the last known mixer after a change
+SNAPSHOT_SAVE_DELAY: Final[float] = 10.0
+
+# Fired when a button of a mixer is pressed
+EVENT_BUTTON: Final[str] = f"{DOMAIN}_button"
+
+PRESS_TYPE_INITIAL: Final[str] = "initial_press"
+PRESS_TYPE_SINGLE: Final[str] = "single_press"
+PRESS_TYPE_DOUBLE: Final[str] = "double_press"
+PRESS_TYPE_LONG: Final[str] = "long_press"
+
+# Seconds a button is held for a long press
+LONG_PRESS_TIME: Final[float] = 0.5
+# Seconds after a release a second press makes a double press
+DOUBLE_PRESS_WINDOW: Final[float] = 0.3
+
+SERVICE_SET_LIGHTING: Final[str] = "set_lighting"
+SERVICE_SET_ROUTING: Final[str] = "set_routing"
+
+ATTR_ACCENT: Final[str] = "accent"
+ATTR_ACTIVE: Final[str] = "active"
+ATTR_BOTTOM: Final[str] = "bottom"
+ATTR_BUTTON: Final[str] = "button"
+ATTR_BUTTONS: Final[str] = "buttons"
+ATTR_FADERS: Final[str] = "faders"
+ATTR_INACTIVE: Final[str] = "inactive"
+ATTR_INPUTS: Final[str] = "inputs"
+ATTR_OUTPUTS: Final[str] = "outputs"
+ATTR_ROUTES: Final[str] = "routes"
+ATTR_STALE: Final[str] = "stale"
+ATTR_TOP: Final[str] = "top"
+ATTR_TYPE: Final[str] = "type"
@@ -2,32 +2,144 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import Task
-from datetime import timedelta
+from asyncio import Queue, QueueFull, Task
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property, partial
 import logging
+import time
 from typing import Any
 
-from goxlrutilityapi.exceptions import (
-    ConnectionClosedException,
-    ConnectionErrorException,
-)
-from goxlrutilityapi.helpers import (
-    get_attribute_names_from_patch,
-    get_mixer_from_status,
+from goxlrutilityapi.const import (
+    ACCENT,
+    COMMAND_TYPE_SET_BUTTON_COLOURS,
+    COMMAND_TYPE_SET_FADER_COLOURS,
+    COMMAND_TYPE_SET_MUTE_STATE,
+    COMMAND_TYPE_SET_SIMPLE_COLOUR,
+    COMMAND_TYPE_SET_VOLUME,
+    KEY_MAP,
+    MUTED_STATE,
+    UNMUTED_STATE,
 )
+from goxlrutilityapi.exceptions import BadMessageException
+from goxlrutilityapi.helpers import get_attribute_names_from_patch
 from goxlrutilityapi.models.patch import Patch
 from goxlrutilityapi.models.response import Response
-from goxlrutilityapi.models.status import Mixer
-from goxlrutilityapi.websocket_client import WebsocketClient
+from goxlrutilityapi.models.status import (
+    ButtonDown,
+    Colours,
+    FaderStatuses,
+    Mixer,
+    Router,
+    RouterItem,
+    Volumes,
+)
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
+from homeassistant.const import (
+    ATTR_DEVICE_ID,
+    CONF_HOST,
+    CONF_PORT,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
-from .helper import CannotConnect, setup_connection
+from .client import GoXLRUtilityClient
+from .connection import (
+    GoXLRUtilityConnection,
+    async_acquire_connection,
+    async_claim_handoff,
+    async_release_connection,
+)
+from .const import (
+    ATTR_BUTTON,
+    ATTR_TYPE,
+    COMMAND_TIMEOUT,
+    COMMAND_TYPE_SET_ROUTER,
+    CONF_LATENCY_PROBE,
+    CONF_OPTIMISTIC,
+    CONF_PATCH_BATCH_WINDOW,
+    CONF_PATCH_OVERFLOW_POLICY,
+    CONNECTION_ERRORS,
+    DEFAULT_ENTITY_GROUPS,
+    DEFAULT_LATENCY_PROBE,
+    DEFAULT_OPTIMISTIC,
+    DEFAULT_PATCH_BATCH_WINDOW,
+    DEFAULT_PATCH_OVERFLOW_POLICY,
+    DEFAULT_WRITE_INTERVALS,
+    DOMAIN,
+    EVENT_BUTTON,
+    LATENCY_PROBE_INTERVAL,
+    LATENCY_PROBE_MAX_INTERVAL,
+    OPTIMISTIC_TIMEOUT,
+    PATCH_OVERFLOW_BLOCK,
+    PATCH_QUEUE_SIZE,
+    RECENT_PATCHES_SIZE,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_VERSION,
+    UNAVAILABLE_GRACE_PERIOD,
+)
+from .events import ButtonPressDetector
+from .helper import CannotConnect, diff_models, get_field_name
+from .metrics import (
+    CommandStatistics,
+    PatchBatchStatistics,
+    PatchPipelineMetrics,
+    ReconnectStatistics,
+    RoundTripMetrics,
+    StateWriteStatistics,
+)
+
+# Builds the command for a target key from the latest values for the target
+CommandBuilder = Callable[[str, dict[str, Any]], dict[str, Any]]
+# An expected value, the last value reported by the device and the cancel
+# callback of the timer rolling back to it
+ExpectedValue = tuple[Any, Any, CALLBACK_TYPE]
+# The latest values of a target, its command builder and the paths of the
+# expected values the command sets
+PendingCommand = tuple[dict[str, Any], CommandBuilder, tuple[tuple[str, ...], ...]]
+
+
+def _get_colour_values(
+    colour_one: str | None,
+    colour_two: str | None,
+) -> dict[str, str]:
+    """Get the command values for the colours being set.
+
+    Colours are upper case like the daemon reports them, so the echo of a
+    command matches the value it was expected to set.
+    """
+    values: dict[str, str] = {}
+    if colour_one is not None:
+        values["colour_one"] = colour_one.upper()
+    if colour_two is not None:
+        values["colour_two"] = colour_two.upper()
+    return values
+
+
+def _is_same_colour(colour: str | None, current: str | None) -> bool:
+    """Return if setting a colour keeps the current one, None keeps it."""
+    if colour is None:
+        return True
+    # The mixer does not report every colour
+    return current is not None and colour.upper() == current.upper()
+
+
+@dataclass(frozen=True, slots=True)
+class GoXLRUtilityDeviceContext:
+    """Device details shared by all entities of a mixer."""
+
+    name: str
+    unique_id_prefix: str
+    device_info: DeviceInfo
 
 
 class GoXLRUtilityDataUpdateCoordinator(DataUpdateCoordinator[Mixer]):
@@ -41,146 +153,1029 @@ class GoXLRUtilityDataUpdateCoordinator(DataUpdateCoordinator[Mixer]):
         entry: ConfigEntry,
     ) -> None:
         """Initialize global GoXLR Utility data updater."""
+        self._button_presses = ButtonPressDetector(hass, self._async_fire_button_event)
+        # Values of issued commands by path with the time they were issued,
+        # until the device patches the path to the value
+        self._command_echoes: dict[tuple[str, ...], tuple[Any, float]] = {}
+        self._command_tasks: dict[tuple[str, str], Task] = {}
+        self._device_id: str | None = None
         self._entry_data: dict[str, Any] = entry.data.copy()
-        self._listener_task: Task | None = None
-        self.client: WebsocketClient | None = None
+        # Optimistic values by the path they were set on
+        self._expected_values: dict[tuple[str, ...], ExpectedValue] = {}
+        self._latency_probe: bool = entry.options.get(
+            CONF_LATENCY_PROBE,
+            DEFAULT_LATENCY_PROBE,
+        )
+        self._optimistic: bool = entry.options.get(CONF_OPTIMISTIC, DEFAULT_OPTIMISTIC)
+        self._patch_batch_window: float = entry.options.get(
+            CONF_PATCH_BATCH_WINDOW,
+            DEFAULT_PATCH_BATCH_WINDOW,
+        )
+        self._patch_consumer_task: Task | None = None
+        self._patch_overflow_policy: str = entry.options.get(
+            CONF_PATCH_OVERFLOW_POLICY,
+            DEFAULT_PATCH_OVERFLOW_POLICY,
+        )
+        # Commands waiting for their target
+        self._pending_commands: dict[tuple[str, str], PendingCommand] = {}
+        # Patches with the time they were received
+        self._patch_queue: Queue[tuple[float, Patch]] = Queue(PATCH_QUEUE_SIZE)
+        self._path_listeners: dict[tuple[str, ...], list[CALLBACK_TYPE]] = {}
+        self._path_descendants: dict[tuple[str, ...], set[tuple[str, ...]]] = {}
+        # Whether patches or commands flowed since the last latency probe
+        self._probe_activity = False
+        self._probe_task: Task | None = None
+        self._probe_unsub: CALLBACK_TYPE | None = None
+        self._resync_task: Task | None = None
+        self._shutdown = False
+        self._snapshot_scheduled = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            STORAGE_VERSION,
+            f"{DOMAIN}.{entry.entry_id}",
+        )
+        self._unavailable_unsub: CALLBACK_TYPE | None = None
+        self.batch_statistics = PatchBatchStatistics()
+        self.command_statistics = CommandStatistics()
+        # Options of the entity groups that are turned on
+        self.entity_groups: set[str] = {
+            group
+            for group, default in DEFAULT_ENTITY_GROUPS.items()
+            if entry.options.get(group, default)
+        }
+        self.metrics = PatchPipelineMetrics()
+        # Recently applied patches with the time they were received and the
+        # milliseconds it took to apply them
+        self.recent_patches: deque[tuple[float, Patch, float]] = deque(
+            maxlen=RECENT_PATCHES_SIZE
+        )
+        # Mixers are matched to their entry by serial number
+        self.serial: str = entry.unique_id or ""
+        self._button_down_prefix = f"/mixers/{self.serial}/button_down/"
+        self.round_trip_metrics = RoundTripMetrics()
+        # Whether the data is the last known mixer from before a restart
+        self.stale = False
+        self.state_write_statistics = StateWriteStatistics()
         self.title = entry.title
         self.unsub: CALLBACK_TYPE | None = None
+        # Minimum seconds between state writes of an entity by option
+        self.write_intervals: dict[str, float] = {
+            option: entry.options.get(option, default)
+            for option, default in DEFAULT_WRITE_INTERVALS.items()
+        }
 
         super().__init__(
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),
+            # Updates are pushed, reconnects are handled by the supervisor
+            update_interval=None,
+        )
+
+        self.connection: GoXLRUtilityConnection = async_acquire_connection(
+            hass,
+            self._entry_data[CONF_HOST],
+            self._entry_data[CONF_PORT],
+            self,
         )
 
+    @cached_property
+    def device_context(self) -> GoXLRUtilityDeviceContext:
+        """Return the device details, built once from the first data."""
+        usb_device = self.data.hardware.usb_device
+        name = f"{usb_device.manufacturer_name} {usb_device.product_name}"
+        return GoXLRUtilityDeviceContext(
+            name=name,
+            unique_id_prefix=self.data.hardware.serial_number,
+            device_info=DeviceInfo(
+                configuration_url=(
+                    f"http://{self._entry_data[CONF_HOST]}:{self._entry_data[CONF_PORT]}"
+                ),
+                hw_version=".".join(str(item) for item in usb_device.version),
+                identifiers={(DOMAIN, self.data.hardware.serial_number)},
+                manufacturer=usb_device.manufacturer_name,
+                model=usb_device.product_name,
+                name=name,
+            ),
+        )
+
+    @property
+    def client(self) -> GoXLRUtilityClient | None:
+        """Return the client of the shared connection."""
+        return self.connection.client
+
+    @property
+    def reconnect_statistics(self) -> ReconnectStatistics:
+        """Return the reconnect statistics of the shared connection."""
+        return self.connection.reconnect_statistics
+
     @property
     def is_ready(self) -> bool:
         """Return if the data is ready."""
         return self.data is not None
 
-    async def setup(self) -> None:
-        """Set up connection to Websocket."""
+    @callback
+    def async_add_path_listener(
+        self,
+        path: tuple[str, ...],
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Listen for patches to a subtree of the data.
 
-        self.client = await setup_connection(
-            self.hass,
-            self._entry_data.copy(),
-        )
+        The path is made up of the attribute names of the data model,
+        e.g. ("lighting", "buttons", "fader1_mute").
+        """
+        self._path_listeners.setdefault(path, []).append(update_callback)
+        for index in range(len(path)):
+            self._path_descendants.setdefault(path[:index], set()).add(path)
 
-        async def listen_for_patches() -> None:
-            """Listen for patches from GoXLR Utility."""
-            if self.client is None:
-                raise ConfigEntryNotReady("Websocket not connected")
+        @callback
+        def remove_path_listener() -> None:
+            """Remove path listener."""
+            listeners = self._path_listeners[path]
+            listeners.remove(update_callback)
+            if listeners:
+                return
+            del self._path_listeners[path]
+            for index in range(len(path)):
+                descendants = self._path_descendants[path[:index]]
+                descendants.discard(path)
+                if not descendants:
+                    del self._path_descendants[path[:index]]
 
-            try:
-                await self.client.listen(self.patch_callback)
-            except (ConnectionClosedException, ConnectionResetError) as exception:
-                self.logger.debug(
-                    "Websocket connection closed for %s. Will retry: %s",
-                    self.title,
-                    exception,
-                )
-                if self.unsub:
-                    self.unsub()
-                    self.unsub = None
-                self.last_update_success = False
-                self.async_update_listeners()
-            except ConnectionErrorException as exception:
-                self.logger.debug(
-                    "Connection error occurred for %s. Will retry: %s",
-                    self.title,
-                    exception,
-                )
-                if self.unsub:
-                    self.unsub()
-                    self.unsub = None
-                self.last_update_success = False
-                self.async_update_listeners()
+        return remove_path_listener
 
-        self._listener_task = self.hass.async_create_background_task(
-            listen_for_patches(),
-            name="GoXLR Utility Patch Listener",
-        )
+    @callback
+    def async_update_path_listeners(
+        self,
+        changed_paths: Iterable[tuple[str, ...]],
+    ) -> None:
+        """Update listeners of the subtrees affected by the changed paths."""
+        update_callbacks: dict[CALLBACK_TYPE, None] = {}
+        for changed_path in changed_paths:
+            # Listeners of the changed path or of any subtree containing it
+            for index in range(len(changed_path) + 1):
+                for update_callback in self._path_listeners.get(
+                    changed_path[:index], ()
+                ):
+                    update_callbacks[update_callback] = None
+            # Listeners of subtrees replaced as part of the changed path
+            for path in self._path_descendants.get(changed_path, ()):
+                for update_callback in self._path_listeners[path]:
+                    update_callbacks[update_callback] = None
+
+        for update_callback in update_callbacks:
+            update_callback()
+
+    async def async_load_snapshot(self) -> None:
+        """Load the last known mixer to show until the daemon is connected."""
+        if (snapshot := await self._store.async_load()) is None:
+            return
+
+        try:
+            self.data = Mixer(**snapshot)
+        except (TypeError, ValueError) as exception:
+            self.logger.warning(
+                "Ignoring invalid snapshot of %s: %s", self.title, exception
+            )
+            return
+        self.stale = True
+
+    @callback
+    def _async_schedule_snapshot(self) -> None:
+        """Save the mixer after a delay, collecting the changes until then."""
+        if self._snapshot_scheduled:
+            return
+        self._snapshot_scheduled = True
+        self._store.async_delay_save(self._get_snapshot, SNAPSHOT_SAVE_DELAY)
+
+    def _get_snapshot(self) -> dict[str, Any]:
+        """Get the mixer to save."""
+        self._snapshot_scheduled = False
+        return self.data.dict(by_alias=True, exclude_none=True)
+
+    async def setup(self) -> None:
+        """Set up connection to Websocket."""
+        if self._patch_consumer_task is None:
+            self._patch_consumer_task = self.hass.async_create_background_task(
+                self._consume_patches(),
+                name="GoXLR Utility Patch Consumer",
+            )
 
         async def cleanup(_: Event) -> None:
             """Disconnect and cleanup items."""
+            # The listener is removed once it fired
+            self.unsub = None
             await self.cleanup()
 
         # Cleanup on Home Assistant shutdown
+        if self.unsub:
+            self.unsub()
         self.unsub = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_STOP,
             cleanup,
         )
 
+        client: GoXLRUtilityClient | None = None
+        if (self.data is None or self.stale) and (
+            handoff := await async_claim_handoff(
+                self.hass,
+                self.serial,
+                self._entry_data[CONF_HOST],
+                self._entry_data[CONF_PORT],
+            )
+        ):
+            # Continue from the config flow. Patches it did not read are
+            # still waiting in the socket, but the ones its listener read
+            # after the status reply are lost, so resync once connected
+            self.logger.debug("Using the connection and mixer of the config flow")
+            client = handoff.client
+            self.stale = False
+            self.async_set_updated_data(handoff.mixer)
+            self._async_schedule_snapshot()
+
+        if self._latency_probe and self._probe_unsub is None:
+            self._async_schedule_probe(LATENCY_PROBE_INTERVAL)
+
+        if self.stale and not self.connection.connected:
+            # Show the last known mixer right away instead of waiting for a
+            # connect attempt, the reconnect resyncs it once connected
+            self.logger.debug("Connecting to %s in the background", self.title)
+            self.connection.async_reconnect()
+            return
+        await self.connection.async_connect(client)
+
+        if client is not None and (
+            self._resync_task is None or self._resync_task.done()
+        ):
+            self._resync_task = self.hass.async_create_background_task(
+                self._resync(),
+                name="GoXLR Utility Resync",
+            )
+
+    @callback
+    def _async_schedule_probe(self, interval: float) -> None:
+        """Schedule the next latency probe."""
+        self.round_trip_metrics.probe_interval = interval
+        self._probe_unsub = async_call_later(self.hass, interval, self._async_probe)
+
+    @callback
+    def _async_probe(self, _: datetime) -> None:
+        """Start a latency probe."""
+        self._probe_unsub = None
+        self._probe_task = self.hass.async_create_background_task(
+            self._probe(),
+            f"{DOMAIN} {self.title} latency probe",
+        )
+
+    async def _probe(self) -> None:
+        """Ping the daemon and schedule the next ping.
+
+        The interval is reset while patches or commands flow and doubled for
+        every ping without any in between, so an idle daemon is rarely pinged.
+        """
+        if self.client is not None and self.connection.connected:
+            started = time.perf_counter()
+            try:
+                await self.client.ping()
+            except (
+                *CONNECTION_ERRORS,
+                asyncio.TimeoutError,
+                BadMessageException,
+            ) as exception:
+                self.round_trip_metrics.failed_probes += 1
+                self.logger.debug(
+                    "Latency probe of %s failed: %s", self.title, exception
+                )
+            else:
+                self.round_trip_metrics.probes += 1
+                self.round_trip_metrics.probe_time.record(
+                    (time.perf_counter() - started) * 1000
+                )
+
+        if self._shutdown:
+            return
+        # Activity during the ping counts towards the next interval
+        interval = LATENCY_PROBE_INTERVAL
+        if not self._probe_activity and self.round_trip_metrics.probe_interval:
+            interval = min(
+                LATENCY_PROBE_MAX_INTERVAL,
+                self.round_trip_metrics.probe_interval * 2,
+            )
+        self._probe_activity = False
+        self._async_schedule_probe(interval)
+
+    @callback
+    def _async_probe_activity(self) -> None:
+        """Note patches or commands flowing, probing soon after being idle."""
+        if self._probe_activity:
+            return
+        self._probe_activity = True
+        if (
+            self._probe_unsub is not None
+            and self.round_trip_metrics.probe_interval is not None
+            and self.round_trip_metrics.probe_interval > LATENCY_PROBE_INTERVAL
+        ):
+            self._probe_unsub()
+            self._async_schedule_probe(LATENCY_PROBE_INTERVAL)
+
+    @callback
+    def async_connection_lost(self) -> None:
+        """Handle a lost connection to GoXLR Utility."""
+        if self._shutdown:
+            return
+
+        # Releases sent while disconnected are lost
+        self._button_presses.async_reset()
+
+        # Give the connection a chance to recover before marking unavailable
+        if self._unavailable_unsub is None and self.last_update_success:
+            self._unavailable_unsub = async_call_later(
+                self.hass,
+                UNAVAILABLE_GRACE_PERIOD,
+                self._async_mark_unavailable,
+            )
+
+    @callback
+    def _async_mark_unavailable(self, _: datetime | None = None) -> None:
+        """Mark the data unavailable."""
+        self._unavailable_unsub = None
+        self.last_update_success = False
+        self.async_update_listeners()
+
+    @callback
+    def async_resync(self, mixer: Mixer) -> None:
+        """Reconcile the data with a freshly fetched mixer."""
+        if self._unavailable_unsub is not None:
+            self._unavailable_unsub()
+            self._unavailable_unsub = None
+
+        # The fresh mixer replaces any values still waiting for confirmation
+        self._async_clear_expected_values()
+        self._command_echoes.clear()
+
+        self._async_schedule_snapshot()
+
+        # Availability and staleness changes need every listener to be updated
+        if self.data is None or not self.last_update_success or self.stale:
+            self.stale = False
+            self.async_set_updated_data(mixer)
+            return
+
+        changes = diff_models(self.data, mixer)
+        data = self.data
+        for attribute_names, value in changes:
+            data = self._set_value(data, attribute_names, value)
+        self.data = data
+        self.logger.debug("Resynced %s changed values", len(changes))
+
+        started = time.perf_counter()
+        self.async_update_path_listeners(
+            attribute_names for attribute_names, _ in changes
+        )
+        self.metrics.listener_time.record((time.perf_counter() - started) * 1000)
+
     async def cleanup(self) -> None:
         """Disconnect and cleanup items."""
-        if self.client is not None:
-            await self.client.disconnect()
+        self._shutdown = True
+        if self.unsub is not None:
+            self.unsub()
+            self.unsub = None
+        if self._unavailable_unsub is not None:
+            self._unavailable_unsub()
+            self._unavailable_unsub = None
+        if self._probe_unsub is not None:
+            self._probe_unsub()
+            self._probe_unsub = None
+        for task in (self._patch_consumer_task, self._probe_task, self._resync_task):
+            if task is not None:
+                task.cancel()
+        self._patch_consumer_task = None
+        self._probe_task = None
+        self._resync_task = None
+        for task in self._command_tasks.values():
+            task.cancel()
+        self._command_tasks.clear()
+        self._pending_commands.clear()
+        self._async_clear_expected_values()
+        self._command_echoes.clear()
+        self._button_presses.async_reset()
+        while not self._patch_queue.empty():
+            self._patch_queue.get_nowait()
 
-    async def _get_mixer(self) -> Mixer:
-        """Get mixer from GoXLR Utility."""
-        if self.client is None or not self.client.connected:
-            raise ConfigEntryNotReady("Websocket not connected")
+        # Save now instead of waiting for the delayed save
+        if self._snapshot_scheduled:
+            await self._store.async_save(self._get_snapshot())
 
-        # Get status and mixer
-        status = await self.client.get_status()
-        mixer = get_mixer_from_status(status)
-        if mixer is None:
-            raise ConfigEntryNotReady("No mixer found")
-        return mixer
+        await async_release_connection(self.hass, self.connection, self)
 
-    async def _patch_callback_task(
+    @callback
+    def async_schedule_command(
         self,
-        patch: Patch,
+        target: tuple[str, str],
+        values: dict[str, Any],
+        build: CommandBuilder,
+        paths: tuple[tuple[str, ...], ...] = (),
     ) -> None:
-        """Patch response callback task."""
-        # Get new data
-        new_data = self.data
-        if new_data is None:
-            self.logger.debug("No data available")
+        """Schedule a command for a target such as a channel or a button.
+
+        Values of a command still waiting to be sent for the same target are
+        replaced by the newer ones, so only the latest values go out and
+        there is at most one command in flight per target. The expected
+        values of the paths are rolled back if the command is not sent.
+        """
+        self.command_statistics.scheduled += 1
+        self._async_probe_activity()
+        if (pending := self._pending_commands.get(target)) is not None:
+            self.command_statistics.coalesced += 1
+            values = {**pending[0], **values}
+            paths = tuple(dict.fromkeys((*pending[2], *paths)))
+        self._pending_commands[target] = (values, build, paths)
+
+        if target not in self._command_tasks:
+            self._command_tasks[target] = self.hass.async_create_background_task(
+                self._send_commands(target),
+                f"{DOMAIN} {self.title} {' '.join(target)} commands",
+            )
+
+    async def _send_commands(self, target: tuple[str, str]) -> None:
+        """Send the pending commands for a target one at a time.
+
+        Each command stays in flight until the daemon replies to it, while
+        the commands of other targets are sent alongside it.
+        """
+        try:
+            while (pending := self._pending_commands.pop(target, None)) is not None:
+                if (
+                    self.client is None
+                    or not self.client.connected
+                    or self.data is None
+                ):
+                    self.command_statistics.failed += 1
+                    self.logger.warning(
+                        "Not connected, dropped %s command to %s",
+                        target[0],
+                        self.title,
+                    )
+                    self._async_roll_back_command(target, pending[2])
+                    continue
+                values, build, paths = pending
+                started = time.perf_counter()
+                try:
+                    await self.client.send_command(
+                        self.data.hardware.serial_number,
+                        build(target[1], values),
+                    )
+                except (
+                    *CONNECTION_ERRORS,
+                    asyncio.TimeoutError,
+                    BadMessageException,
+                ) as exception:
+                    self.command_statistics.failed += 1
+                    self.logger.warning(
+                        "Error sending %s command to %s: %s",
+                        target[0],
+                        self.title,
+                        exception,
+                    )
+                    self._async_roll_back_command(target, paths)
+                else:
+                    self.command_statistics.sent += 1
+                    self.metrics.command_time.record(
+                        (time.perf_counter() - started) * 1000
+                    )
+        finally:
+            self._command_tasks.pop(target, None)
+
+    @callback
+    def _async_roll_back_command(
+        self,
+        target: tuple[str, str],
+        paths: tuple[tuple[str, ...], ...],
+    ) -> None:
+        """Roll back the expected values of a command that was not sent."""
+        # A newer command for the target still sets the paths it shares
+        if (pending := self._pending_commands.get(target)) is not None:
+            paths = tuple(path for path in paths if path not in pending[2])
+        self._async_roll_back_expected_values(paths)
+
+    @callback
+    def async_set_expected_value(self, path: tuple[str, ...], value: Any) -> None:
+        """Show the value a command is expected to set until it is confirmed.
+
+        Only the listeners of the path are updated. A device patch with the
+        same value confirms it, any other value is kept as the value to roll
+        back to if the expected value is not confirmed in time. The time until
+        the device patches the value is measured as the command echo time,
+        optimistic or not.
+        """
+        self._command_echoes[path] = (value, time.perf_counter())
+        if not self._optimistic or self.data is None:
+            return
+
+        parent: Any = self.data
+        for attribute_name in path[:-1]:
+            # The mixer does not report every subtree, such as the routes of
+            # inputs it does not have, so there is no value to show
+            if (parent := getattr(parent, attribute_name)) is None:
+                return
+
+        if (expected := self._expected_values.pop(path, None)) is not None:
+            _, device_value, cancel = expected
+            cancel()
+        else:
+            device_value = getattr(parent, path[-1])
+        self._expected_values[path] = (
+            value,
+            device_value,
+            async_call_later(
+                self.hass,
+                OPTIMISTIC_TIMEOUT,
+                partial(self._async_roll_back_expected_value, path),
+            ),
+        )
+        self.data = self._set_value(self.data, path, value)
+        self.async_update_path_listeners((path,))
+
+    def _reconcile_expected_value(self, path: tuple[str, ...], value: Any) -> Any:
+        """Confirm an expected value with a patched value from the device.
+
+        Returns the value to show for the path.
+        """
+        expected, _, cancel = self._expected_values[path]
+        if value == expected:
+            cancel()
+            del self._expected_values[path]
+            self.command_statistics.confirmed += 1
+            return value
+
+        # Likely an echo of an older command, keep showing the expected value
+        self._expected_values[path] = (expected, value, cancel)
+        return expected
+
+    def _record_command_echo(
+        self,
+        path: tuple[str, ...],
+        value: Any,
+        received: float,
+    ) -> None:
+        """Measure the echo time of a command the patched value matches."""
+        expected, issued = self._command_echoes[path]
+        if received - issued > COMMAND_TIMEOUT:
+            # The command changed nothing, this patch is not its echo
+            del self._command_echoes[path]
+        elif value == expected:
+            del self._command_echoes[path]
+            self.round_trip_metrics.command_echo_time.record((received - issued) * 1000)
+
+    @callback
+    def _async_roll_back_expected_value(
+        self,
+        path: tuple[str, ...],
+        _: datetime,
+    ) -> None:
+        """Roll back an expected value the device did not confirm in time."""
+        self._async_roll_back_expected_values((path,))
+
+    @callback
+    def _async_roll_back_expected_values(
+        self,
+        paths: tuple[tuple[str, ...], ...],
+    ) -> None:
+        """Roll back expected values and update the listeners of their paths."""
+        if (data := self.data) is None:
             return
 
+        changed_paths: list[tuple[str, ...]] = []
+        for path in paths:
+            if (expected := self._expected_values.pop(path, None)) is None:
+                continue
+            _, device_value, cancel = expected
+            cancel()
+            self.logger.debug("Rolling back unconfirmed value of %s", path)
+            self.command_statistics.rolled_back += 1
+            if (new_data := self._set_value(data, path, device_value)) is not data:
+                data = new_data
+                changed_paths.append(path)
+
+        if changed_paths:
+            self.data = data
+            self.async_update_path_listeners(changed_paths)
+
+    @callback
+    def _async_clear_expected_values(self) -> None:
+        """Forget all expected values."""
+        for _, _, cancel in self._expected_values.values():
+            cancel()
+        self._expected_values.clear()
+
+    @callback
+    def async_set_volume(self, channel: str, volume: int) -> None:
+        """Set the volume of a channel."""
+        path = ("levels", "volumes", get_field_name(Volumes, channel))
+        self.async_set_expected_value(path, volume)
+        self.async_schedule_command(
+            ("volume", channel),
+            {"volume": volume},
+            lambda key, values: {COMMAND_TYPE_SET_VOLUME: [key, values["volume"]]},
+            (path,),
+        )
+
+    @callback
+    def async_set_muted(self, fader: str, muted: bool) -> None:
+        """Set the muted state of a fader."""
+        path = ("fader_status", get_field_name(FaderStatuses, fader), "mute_state")
+        self.async_set_expected_value(path, MUTED_STATE if muted else UNMUTED_STATE)
+        self.async_schedule_command(
+            ("mute", fader),
+            {"muted": muted},
+            lambda key, values: {
+                COMMAND_TYPE_SET_MUTE_STATE: [
+                    key,
+                    MUTED_STATE if values["muted"] else UNMUTED_STATE,
+                ]
+            },
+            (path,),
+        )
+
+    @callback
+    def async_set_accent_colour(self, colour: str) -> None:
+        """Set the accent colour."""
+        # Upper case like the daemon reports it
+        colour = colour.upper()
+        path = ("lighting", "simple", "accent", "colour_one")
+        if self.data is not None and self.data.lighting.simple.accent is not None:
+            self.async_set_expected_value(path, colour)
+        self.async_schedule_command(
+            ("accent", "accent"),
+            {"colour": colour},
+            lambda _, values: {
+                COMMAND_TYPE_SET_SIMPLE_COLOUR: [ACCENT, values["colour"]]
+            },
+            (path,),
+        )
+
+    @callback
+    def async_set_button_colours(
+        self,
+        item_key: str,
+        colour_one: str | None = None,
+        colour_two: str | None = None,
+    ) -> None:
+        """Set one or both colours of a button, keeping the other."""
+        values = _get_colour_values(colour_one, colour_two)
+        paths = self._async_set_expected_colours(
+            ("lighting", "buttons", item_key), values
+        )
+        self.async_schedule_command(
+            ("button", item_key),
+            values,
+            self._build_button_colours,
+            paths,
+        )
+
+    @callback
+    def _async_set_expected_colours(
+        self,
+        path: tuple[str, ...],
+        values: dict[str, str],
+    ) -> tuple[tuple[str, ...], ...]:
+        """Show the colours a command is expected to set and return their paths."""
+        paths = tuple((*path, "colours", name) for name in values)
+        for colour_path, colour in zip(paths, values.values()):
+            self.async_set_expected_value(colour_path, colour)
+        return paths
+
+    def _build_button_colours(
+        self,
+        item_key: str,
+        values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the command setting both colours of a button."""
+        colours = getattr(self.data.lighting.buttons, item_key).colours or Colours()
+        return {
+            COMMAND_TYPE_SET_BUTTON_COLOURS: [
+                KEY_MAP[item_key],
+                values.get("colour_one", colours.colour_one),
+                values.get("colour_two", colours.colour_two),
+            ]
+        }
+
+    @callback
+    def async_set_fader_colours(
+        self,
+        item_key: str,
+        colour_one: str | None = None,
+        colour_two: str | None = None,
+    ) -> None:
+        """Set one or both colours of a fader, keeping the other."""
+        values = _get_colour_values(colour_one, colour_two)
+        paths = self._async_set_expected_colours(
+            ("lighting", "faders", item_key), values
+        )
+        self.async_schedule_command(
+            ("fader", item_key),
+            values,
+            self._build_fader_colours,
+            paths,
+        )
+
+    def _build_fader_colours(
+        self,
+        item_key: str,
+        values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the command setting both colours of a fader."""
+        colours = getattr(self.data.lighting.faders, item_key).colours or Colours()
+        return {
+            COMMAND_TYPE_SET_FADER_COLOURS: [
+                KEY_MAP[item_key],
+                values.get("colour_one", colours.colour_one),
+                values.get("colour_two", colours.colour_two),
+            ]
+        }
+
+    @callback
+    def async_set_lighting(
+        self,
+        accent: str | None,
+        buttons: dict[str, tuple[str | None, str | None]],
+        faders: dict[str, tuple[str | None, str | None]],
+    ) -> int:
+        """Set many colours at once and return the number of commands.
+
+        Colour pairs are merged into one command per button or fader, missing
+        colours keep their current value and unchanged targets are skipped.
+        """
+        if self.data is None:
+            return 0
+
+        commands = 0
+        lighting = self.data.lighting
+        if accent is not None and (
+            lighting.simple.accent is None
+            or not _is_same_colour(accent, lighting.simple.accent.colour_one)
+        ):
+            self.async_set_accent_colour(accent)
+            commands += 1
+
+        for items, requested, set_colours in (
+            (lighting.buttons, buttons, self.async_set_button_colours),
+            (lighting.faders, faders, self.async_set_fader_colours),
+        ):
+            for item_key, (colour_one, colour_two) in requested.items():
+                if item_key not in KEY_MAP:
+                    continue
+                current = getattr(items, item_key).colours or Colours()
+                if _is_same_colour(colour_one, current.colour_one) and _is_same_colour(
+                    colour_two, current.colour_two
+                ):
+                    continue
+                set_colours(item_key, colour_one, colour_two)
+                commands += 1
+
+        return commands
+
+    @callback
+    def async_set_route(
+        self,
+        router_input: str,
+        router_output: str,
+        enabled: bool,
+    ) -> None:
+        """Route an input to an output or remove the route."""
+        path = ("router", router_input, router_output)
+        self.async_set_expected_value(path, enabled)
+        input_alias = Router.__fields__[router_input].alias
+        output_alias = RouterItem.__fields__[router_output].alias
+        self.async_schedule_command(
+            ("route", f"{router_input} {router_output}"),
+            {"enabled": enabled},
+            lambda _, values: {
+                COMMAND_TYPE_SET_ROUTER: [input_alias, output_alias, values["enabled"]]
+            },
+            (path,),
+        )
+
+    @callback
+    def async_set_routing(self, routes: dict[str, dict[str, bool]]) -> int:
+        """Set many routes at once and return the number of commands.
+
+        Only the routes that differ from the current routing are sent, the
+        daemon sets one route per command.
+        """
+        if self.data is None:
+            return 0
+
+        commands = 0
+        for router_input, outputs in routes.items():
+            # Inputs the mixer does not have are not routed
+            if (item := getattr(self.data.router, router_input, None)) is None:
+                continue
+            for router_output, enabled in outputs.items():
+                if getattr(item, router_output) == enabled:
+                    continue
+                self.async_set_route(router_input, router_output, enabled)
+                commands += 1
+
+        return commands
+
+    def _apply_patch(
+        self,
+        data: Mixer,
+        patch: Patch,
+        received: float,
+    ) -> tuple[Mixer, tuple[str, ...] | None]:
+        """Return the data with a patch applied and the patched path."""
         # Get attribute names from patch path
-        attribute_names = get_attribute_names_from_patch(new_data, patch)
-        self.logger.info("Update '%s': %s", attribute_names, patch.value)
+        started = time.perf_counter()
+        try:
+            path = tuple(get_attribute_names_from_patch(data, patch))
+        except ValueError:
+            return data, None
+        except (AttributeError, TypeError) as exception:
+            # Subtrees such as effects and the sampler are not modelled
+            self.logger.debug("Skipping patch of %s: %s", patch.path, exception)
+            return data, None
+        resolved = time.perf_counter()
+        self.metrics.resolve_time.record((resolved - started) * 1000)
+        self.logger.debug("Update '%s': %s", path, patch.value)
 
-        # Update data
-        current_attribute = new_data
+        value = patch.value
+        if path in self._command_echoes:
+            self._record_command_echo(path, value, received)
+        if path in self._expected_values:
+            value = self._reconcile_expected_value(path, value)
+        data = self._set_value(data, path, value)
+        self.metrics.set_time.record((time.perf_counter() - resolved) * 1000)
+        return data, path
+
+    def _set_value(
+        self,
+        data: Mixer,
+        attribute_names: list[str] | tuple[str, ...],
+        value: Any,
+    ) -> Mixer:
+        """Return the data with a value set from its attribute names.
+
+        The data is never changed in place. The models along the path are
+        copied and every other subtree is shared with the given data, so an
+        unchanged subtree is the same object in both. The given data is
+        returned as is when it already holds the value, or when a model along
+        the path is not reported by the mixer.
+        """
+        models: list[Any] = [data]
         for attribute_name in attribute_names[:-1]:
-            current_attribute = getattr(current_attribute, attribute_name)
-        setattr(current_attribute, attribute_names[-1], patch.value)
-        self.logger.debug("Updated data: %s", new_data)
-        self.async_set_updated_data(new_data)
+            if (model := getattr(models[-1], attribute_name)) is None:
+                return data
+            models.append(model)
+        if getattr(models[-1], attribute_names[-1]) == value:
+            return data
 
-        # Update listeners
-        self.last_update_success = True
-        self.async_update_listeners()
+        for model, attribute_name in zip(reversed(models), reversed(attribute_names)):
+            value = model.copy(update={attribute_name: value})
+        return value
+
+    @callback
+    def _apply_patches(self, patches: list[tuple[float, Patch]]) -> None:
+        """Apply patches in order and notify affected listeners once."""
+        if (data := self.data) is None:
+            self.logger.debug("No data available")
+            return
+
+        # Patches that leave the data as it is change no path
+        changed_paths: dict[tuple[str, ...], None] = {}
+        for received, patch in patches:
+            started = time.perf_counter()
+            new_data, path = self._apply_patch(data, patch, received)
+            if new_data is not data and path is not None:
+                changed_paths[path] = None
+                data = new_data
+            applied = time.perf_counter()
+            self.metrics.apply_latency.record((applied - received) * 1000)
+            self.recent_patches.append((received, patch, (applied - started) * 1000))
+        self.batch_statistics.record(len(patches))
+        self.logger.debug("Applied batch of %s patches", len(patches))
+        if changed_paths:
+            self.data = data
+            self._async_schedule_snapshot()
+
+        # Availability changes need every listener to be updated
+        if not self.last_update_success:
+            self.async_set_updated_data(data)
+            return
+
+        # Update listeners of the changed paths only
+        started = time.perf_counter()
+        self.async_update_path_listeners(changed_paths)
+        self.metrics.listener_time.record((time.perf_counter() - started) * 1000)
+
+    async def _consume_patches(self) -> None:
+        """Apply queued patches in arrival order."""
+        queue = self._patch_queue
+        while True:
+            patches = [await queue.get()]
+            # Collect the rest of the burst to apply as one batch
+            if self._patch_batch_window > 0:
+                await asyncio.sleep(self._patch_batch_window)
+            while not queue.empty():
+                patches.append(queue.get_nowait())
+            try:
+                self._apply_patches(patches)
+            except Exception:  # pylint: disable=broad-except
+                # Keep applying the patches that follow
+                self.logger.exception("Error applying patches to %s", self.title)
+
+    async def _resync(self) -> None:
+        """Fetch the mixer and reconcile the data with it."""
+        try:
+            mixer = await self.connection.async_get_mixer(self.serial)
+        except (
+            asyncio.TimeoutError,
+            BadMessageException,
+            ConfigEntryNotReady,
+            *CONNECTION_ERRORS,
+        ) as exception:
+            self.logger.warning("Could not resync %s: %s", self.title, exception)
+            return
+        self.async_resync(mixer)
+
+    @callback
+    def _async_patch_queue_overflow(self) -> None:
+        """Drop the queued patches and resync the data instead."""
+        dropped = self._patch_queue.qsize() + 1
+        while not self._patch_queue.empty():
+            self._patch_queue.get_nowait()
+        self.batch_statistics.dropped += dropped
+        self.logger.warning(
+            "Patch queue full for %s, dropped %s patches and resyncing",
+            self.title,
+            dropped,
+        )
+
+        if self._resync_task is None or self._resync_task.done():
+            self._resync_task = self.hass.async_create_background_task(
+                self._resync(),
+                name="GoXLR Utility Resync",
+            )
 
     async def patch_callback(
         self,
         response: Response[Patch],
     ) -> None:
         """Patch response callback function."""
-        self.hass.async_create_background_task(
-            self._patch_callback_task(response.data),
-            name="Patch Callback Task",
+        received = time.perf_counter()
+        self.metrics.patch_rate.record()
+        self._async_probe_activity()
+        patch = response.data
+        # Button presses are classified on arrival, ahead of the queue
+        if patch.path.startswith(self._button_down_prefix):
+            self._button_presses.async_button_down(
+                get_field_name(ButtonDown, patch.path[len(self._button_down_prefix) :]),
+                bool(patch.value),
+                received,
+            )
+        if self._patch_overflow_policy == PATCH_OVERFLOW_BLOCK:
+            # Hold the websocket reader until there is room in the queue
+            await self._patch_queue.put((received, patch))
+        else:
+            try:
+                self._patch_queue.put_nowait((received, patch))
+            except QueueFull:
+                self._async_patch_queue_overflow()
+        self.metrics.callback_time.record((time.perf_counter() - received) * 1000)
+
+    @callback
+    def _async_fire_button_event(self, button: str, press_type: str) -> None:
+        """Fire a button press event for the device of the mixer."""
+        if self._device_id is None:
+            device = dr.async_get(self.hass).async_get_device({(DOMAIN, self.serial)})
+            if device is None:
+                return
+            self._device_id = device.id
+        self.hass.bus.async_fire(
+            EVENT_BUTTON,
+            {
+                ATTR_DEVICE_ID: self._device_id,
+                ATTR_BUTTON: button,
+                ATTR_TYPE: press_type,
+            },
         )
 
     async def _async_update_data(self) -> Mixer:
         """Update GoXLR Utility data from WebSocket."""
-        if (
-            self.client is None
-            or not self.client.connected
-            or self._listener_task is None
-        ):
+        # The last known mixer is shown while reconnecting in the background
+        if not self.connection.connected and not self.stale:
             try:
                 await self.setup()
             except (asyncio.TimeoutError, CannotConnect) as exception:
                 self.logger.info("Could not connect to GoXLR Utility: %s", exception)
 
-        if self.data is None:
-            mixer: Mixer = await self._get_mixer()
+        if self.data is None or (self.stale and self.connection.connected):
+            mixer: Mixer = await self.connection.async_get_mixer(self.serial)
+            self.stale = False
             self.async_set_updated_data(mixer)
+            self._async_schedule_snapshot()
             self.logger.debug("Data updated: %s", mixer)
 
         if self.data is None:
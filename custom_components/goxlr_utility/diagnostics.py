@@ -0,0 +1,113 @@
+"""Diagnostics support for GoXLR Utility."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timezone
+import json
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import GoXLRUtilityDataUpdateCoordinator
+from .metrics import Histogram, RollingPercentiles
+
+TO_REDACT = {CONF_HOST, "serial_number"}
+
+
+def histogram_diagnostics(histogram: Histogram) -> dict[str, Any]:
+    """Return diagnostics for a histogram."""
+    return {
+        "count": histogram.count,
+        "mean": histogram.mean,
+        "p50": histogram.percentile(50),
+        "p95": histogram.percentile(95),
+        "p99": histogram.percentile(99),
+        "buckets": histogram.buckets,
+    }
+
+
+def rolling_percentiles_diagnostics(rolling: RollingPercentiles) -> dict[str, Any]:
+    """Return diagnostics for rolling percentiles."""
+    return {
+        "count": rolling.count,
+        "p50": rolling.percentile(50),
+        "p95": rolling.percentile(95),
+        "p99": rolling.percentile(99),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    round_trip_metrics = coordinator.round_trip_metrics
+
+    # Convert the monotonic receive times to wall clock times
+    offset = time.time() - time.perf_counter()
+    recent_patches = [
+        {
+            # Drop the /mixers/<serial> prefix
+            "path": "/" + patch.path.split("/", 3)[-1],
+            "value_size": len(json.dumps(patch.value, default=str)),
+            "received": datetime.fromtimestamp(
+                received + offset, timezone.utc
+            ).isoformat(),
+            "apply_duration": apply_duration,
+        }
+        for received, patch, apply_duration in list(coordinator.recent_patches)
+    ]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "connection": {
+            "connected": coordinator.connection.connected,
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "commands_in_flight": (
+                coordinator.client.commands_in_flight
+                if coordinator.client is not None
+                else 0
+            ),
+            "mixers": len(coordinator.connection.coordinators),
+            "reconnects": asdict(coordinator.reconnect_statistics),
+        },
+        "batches": asdict(coordinator.batch_statistics),
+        "commands": asdict(coordinator.command_statistics),
+        "state_writes": asdict(coordinator.state_write_statistics),
+        "metrics": {
+            "patch_rate": coordinator.metrics.patch_rate.rate,
+            "callback_time": histogram_diagnostics(coordinator.metrics.callback_time),
+            "resolve_time": histogram_diagnostics(coordinator.metrics.resolve_time),
+            "set_time": histogram_diagnostics(coordinator.metrics.set_time),
+            "apply_latency": histogram_diagnostics(coordinator.metrics.apply_latency),
+            "listener_time": histogram_diagnostics(coordinator.metrics.listener_time),
+            "command_time": histogram_diagnostics(coordinator.metrics.command_time),
+        },
+        "round_trips": {
+            "probes": round_trip_metrics.probes,
+            "failed_probes": round_trip_metrics.failed_probes,
+            "probe_interval": round_trip_metrics.probe_interval,
+            "probe_time": rolling_percentiles_diagnostics(
+                round_trip_metrics.probe_time
+            ),
+            "command_echo_time": rolling_percentiles_diagnostics(
+                round_trip_metrics.command_echo_time
+            ),
+        },
+        "recent_patches": recent_patches,
+        "mixer": (
+            async_redact_data(coordinator.data.dict(), TO_REDACT)
+            if coordinator.data is not None
+            else None
+        ),
+    }
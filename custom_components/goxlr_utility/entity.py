@@ -1,113 +1,172 @@
 """Entities for GoXLR Utility integration."""
-from collections.abc import Callable
+from collections.abc import Iterable
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any
-
-from homeassistant.components.binary_sensor import BinarySensorEntityDescription
-from homeassistant.components.light import LightEntityDescription
-from homeassistant.components.media_player import MediaPlayerEntityDescription
-from homeassistant.components.sensor import SensorEntityDescription
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.typing import UndefinedType
+import time
+from typing import Any, TypeVar
+
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTR_STALE, DOMAIN
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
 
 
-class ItemType(Enum):
-    """Enum for GoXLR Utility item types."""
-
-    ACCENT = "accent"
-    BUTTON_ACTIVE = "button_active"
-    BUTTON_INACTIVE = "button_inactive"
-    FADER_BOTTOM = "fader_bottom"
-    FADER_TOP = "fader_top"
+@dataclass
+class GoXLRUtilityEntityDescription(EntityDescription):
+    """Class describing GoXLR Utility entities."""
+
+    # Data paths (attribute names) the entity reads its state from
+    paths: tuple[tuple[str, ...], ...] = ()
+    # Option turning the entity group on, entities without one are always created
+    group: str | None = None
+
+
+_DescriptionT = TypeVar("_DescriptionT", bound=GoXLRUtilityEntityDescription)
+
+
+@callback
+def async_get_enabled_descriptions(
+    hass: HomeAssistant,
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
+    platform: Platform,
+    descriptions: Iterable[_DescriptionT],
+) -> list[_DescriptionT]:
+    """Get the descriptions of the entity groups that are turned on.
+
+    Entities of groups turned off are removed from the entity registry, so
+    they do not linger as unavailable.
+    """
+    entity_registry = er.async_get(hass)
+    enabled_descriptions: list[_DescriptionT] = []
+    for description in descriptions:
+        if description.group is None or description.group in coordinator.entity_groups:
+            enabled_descriptions.append(description)
+        elif entity_id := entity_registry.async_get_entity_id(
+            platform,
+            DOMAIN,
+            f"{coordinator.device_context.unique_id_prefix}_{description.key}",
+        ):
+            entity_registry.async_remove(entity_id)
+    return enabled_descriptions
 
 
 class GoXLRUtilityEntity(CoordinatorEntity[GoXLRUtilityDataUpdateCoordinator]):
     """Defines a base GoXLR Utility entity."""
 
+    entity_description: GoXLRUtilityEntityDescription
+    # Option holding the minimum seconds between state writes of the entity
+    _write_interval_option: str | None = None
+
     def __init__(
         self,
         coordinator: GoXLRUtilityDataUpdateCoordinator,
-        entry_data: dict[str, Any],
-        key: str,
-        name: str | UndefinedType | None,
+        description: GoXLRUtilityEntityDescription,
     ) -> None:
         """Initialize the GoXLR Utility entity."""
         super().__init__(coordinator)
-        keys = [
-            coordinator.data.hardware.usb_device.manufacturer_name,
-            coordinator.data.hardware.usb_device.product_name,
-        ]
-        self._device_name = " ".join(keys)
-        self._key = f"{'_'.join(keys).lower()}_{key}"
-        self._name = f"{self._device_name} {name}"
-        self._configuration_url = (
-            f"http://{entry_data[CONF_HOST]}:{entry_data[CONF_PORT]}"
+        self.entity_description = description
+        device_context = coordinator.device_context
+        self._attr_device_info = device_context.device_info
+        self._attr_name = f"{device_context.name} {description.name}"
+        self._attr_unique_id = f"{device_context.unique_id_prefix}_{description.key}"
+        self._last_write = float("-inf")
+        self._trailing_write_unsub: CALLBACK_TYPE | None = None
+        # Availability, state and attributes shown by the last state write
+        self._written_state: tuple[Any, ...] | None = None
+        self._write_interval = (
+            coordinator.write_intervals.get(self._write_interval_option, 0.0)
+            if self._write_interval_option is not None
+            else 0.0
         )
-        self._hw_version = ".".join(
-            [str(item) for item in coordinator.data.hardware.usb_device.version]
-        )
-        self._identifier = coordinator.data.hardware.serial_number
-        self._manufacturer = coordinator.data.hardware.usb_device.manufacturer_name
-        self._model = coordinator.data.hardware.usb_device.product_name
-
-    @property
-    def unique_id(self) -> str:
-        """Return the unique ID for this entity."""
-        return self._key
 
     @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self._name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information about this GoXLR Utility instance."""
-        return DeviceInfo(
-            configuration_url=self._configuration_url,
-            hw_version=self._hw_version,
-            identifiers={(DOMAIN, self._identifier)},
-            manufacturer=self._manufacturer,
-            model=self._model,
-            name=self._device_name,
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        # Flag states of the last known mixer until the daemon is connected
+        if self.coordinator.stale:
+            return {ATTR_STALE: True}
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        for path in self.entity_description.paths:
+            self.async_on_remove(
+                self.coordinator.async_add_path_listener(
+                    path,
+                    self._handle_coordinator_update,
+                )
+            )
+        self.async_on_remove(self._async_cancel_trailing_write)
+        # The state is written right after the entity is added
+        self._written_state = self._get_written_state()
+
+    def _get_written_state(self) -> tuple[Any, ...]:
+        """Return what a state write would show."""
+        if not self.available:
+            return (False,)
+        return (
+            True,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
         )
 
-
-@dataclass
-class GoXLRUtilityBinarySensorEntityDescription(BinarySensorEntityDescription):
-    """Class describing GoXLR Utility binary sensor entities."""
-
-    value: Callable = round
-    item_key: str | None = None
-
-
-@dataclass
-class GoXLRUtilityLightEntityDescription(LightEntityDescription):
-    """Class describing GoXLR Utility light entities."""
-
-    item_type: ItemType = ItemType.ACCENT
-    item_key: str = ""
-
-
-@dataclass
-class GoXLRUtilityMediaPlayerEntityDescription(MediaPlayerEntityDescription):
-    """Class describing GoXLR Utility media player entities."""
-
-    can_mute: bool = False
-    muted_fn: Callable = round
-    volume_pct_fn: Callable = round
-    set_muted_fn: Callable = round
-    set_volume_fn: Callable = round
-
-
-@dataclass
-class GoXLRUtilitySensorEntityDescription(SensorEntityDescription):
-    """Class describing GoXLR Utility sensor entities."""
-
-    value: Callable = round
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state if it changed, at most once per write interval.
+
+        A change after a quiet interval is written right away, later changes
+        inside the interval are written once when it ends, so the last state
+        is never held back.
+        """
+        statistics = self.coordinator.state_write_statistics
+        if self._trailing_write_unsub is not None:
+            statistics.throttled += 1
+            return
+
+        written_state = self._get_written_state()
+        if written_state == self._written_state:
+            statistics.skipped += 1
+            return
+
+        elapsed = time.monotonic() - self._last_write
+        if elapsed < self._write_interval:
+            statistics.throttled += 1
+            self._trailing_write_unsub = async_call_later(
+                self.hass,
+                self._write_interval - elapsed,
+                self._async_trailing_write,
+            )
+            return
+
+        self._async_write_state(written_state)
+
+    @callback
+    def _async_trailing_write(self, _: Any) -> None:
+        """Write the state held back during the write interval."""
+        self._trailing_write_unsub = None
+        written_state = self._get_written_state()
+        if written_state == self._written_state:
+            self.coordinator.state_write_statistics.skipped += 1
+            return
+        self._async_write_state(written_state)
+
+    @callback
+    def _async_write_state(self, written_state: tuple[Any, ...]) -> None:
+        """Write the state and remember what it shows."""
+        self._written_state = written_state
+        self._last_write = time.monotonic()
+        self.coordinator.state_write_statistics.written += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_trailing_write(self) -> None:
+        """Cancel a pending trailing state write."""
+        if self._trailing_write_unsub is not None:
+            self._trailing_write_unsub()
+            self._trailing_write_unsub = None
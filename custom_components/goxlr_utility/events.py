@@ -0,0 +1,130 @@
+"""Button press events for GoXLR Utility integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOUBLE_PRESS_WINDOW,
+    LONG_PRESS_TIME,
+    PRESS_TYPE_DOUBLE,
+    PRESS_TYPE_INITIAL,
+    PRESS_TYPE_LONG,
+    PRESS_TYPE_SINGLE,
+)
+
+
+@dataclass(slots=True)
+class ButtonState:
+    """Press state of a button."""
+
+    # Monotonic times the button was last pressed and released
+    pressed: float | None = None
+    released: float | None = None
+    # Whether the current press was already classified
+    classified: bool = False
+    # Cancels the timer classifying the current press
+    cancel: CALLBACK_TYPE | None = None
+
+
+class ButtonPressDetector:
+    """Classify button presses from the button down patches of a mixer.
+
+    A press is reported right away as an initial press. A press held for
+    the long press time is a long press, a second press within the double
+    press window after a release is a double press, and a release with no
+    second press in that window is a single press.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fire: Callable[[str, str], None],
+    ) -> None:
+        """Initialize the detector with the function firing press events."""
+        self._buttons: dict[str, ButtonState] = {}
+        self._fire = fire
+        self.hass = hass
+
+    @callback
+    def async_button_down(self, button: str, pressed: bool, received: float) -> None:
+        """Handle the down state of a button received at a monotonic time."""
+        state = self._buttons.setdefault(button, ButtonState())
+        if pressed:
+            self._async_pressed(button, state, received)
+        else:
+            self._async_released(button, state, received)
+
+    @callback
+    def _async_pressed(self, button: str, state: ButtonState, received: float) -> None:
+        """Handle a button being pressed."""
+        if state.pressed is not None:
+            return
+        self._async_cancel_timer(state)
+        self._fire(button, PRESS_TYPE_INITIAL)
+
+        if (
+            state.released is not None
+            and received - state.released <= DOUBLE_PRESS_WINDOW
+        ):
+            state.classified = True
+            self._fire(button, PRESS_TYPE_DOUBLE)
+        else:
+            state.classified = False
+            state.cancel = async_call_later(
+                self.hass,
+                LONG_PRESS_TIME,
+                partial(self._async_classify, button, PRESS_TYPE_LONG),
+            )
+        state.pressed = received
+        state.released = None
+
+    @callback
+    def _async_released(self, button: str, state: ButtonState, received: float) -> None:
+        """Handle a button being released."""
+        if (pressed := state.pressed) is None:
+            return
+        self._async_cancel_timer(state)
+        state.pressed = None
+        if state.classified:
+            return
+
+        # The release can arrive before the long press timer fired
+        if received - pressed >= LONG_PRESS_TIME:
+            self._fire(button, PRESS_TYPE_LONG)
+            return
+
+        state.released = received
+        state.cancel = async_call_later(
+            self.hass,
+            DOUBLE_PRESS_WINDOW,
+            partial(self._async_classify, button, PRESS_TYPE_SINGLE),
+        )
+
+    @callback
+    def _async_classify(self, button: str, press_type: str, _: Any) -> None:
+        """Report a press once its timer ran out."""
+        state = self._buttons[button]
+        state.cancel = None
+        state.classified = True
+        state.released = None
+        self._fire(button, press_type)
+
+    @callback
+    def _async_cancel_timer(self, state: ButtonState) -> None:
+        """Cancel the timer classifying the current press."""
+        if state.cancel is not None:
+            state.cancel()
+            state.cancel = None
+
+    @callback
+    def async_reset(self) -> None:
+        """Forget all presses, such as when the connection was lost."""
+        for state in self._buttons.values():
+            self._async_cancel_timer(state)
+        self._buttons.clear()
@@ -1,16 +1,18 @@
 """Helper for GoXLR Utility integration."""
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
 import async_timeout
-from goxlrutilityapi.websocket_client import WebsocketClient
+from goxlrutilityapi.models import DefaultBaseModel
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .client import GoXLRUtilityClient
 from .const import CONNECTION_ERRORS
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,10 +21,10 @@ _LOGGER = logging.getLogger(__name__)
 async def setup_connection(
     hass: HomeAssistant,
     data: dict[str, Any],
-) -> WebsocketClient:
+) -> GoXLRUtilityClient:
     """Set up connection to GoXLR Utility."""
     async with async_timeout.timeout(10):
-        websocket_client = WebsocketClient()
+        websocket_client = GoXLRUtilityClient()
         try:
             await websocket_client.connect(
                 data["host"],
@@ -36,5 +38,37 @@ async def setup_connection(
         return websocket_client
 
 
+def diff_models(
+    old: Any,
+    new: Any,
+    path: tuple[str, ...] = (),
+) -> list[tuple[tuple[str, ...], Any]]:
+    """Get the changed leaves between two models.
+
+    Returns a list of attribute name paths and their new values.
+    """
+    if old is new:
+        return []
+
+    if isinstance(new, DefaultBaseModel) and type(old) is type(new):
+        changes: list[tuple[tuple[str, ...], Any]] = []
+        for name, value in vars(new).items():
+            changes.extend(diff_models(getattr(old, name, None), value, (*path, name)))
+        return changes
+
+    if old == new:
+        return []
+    return [(path, new)]
+
+
+@lru_cache(maxsize=None)
+def get_field_name(model: type[DefaultBaseModel], alias: str) -> str:
+    """Get the attribute name of a model field from its alias."""
+    for name, field in model.__fields__.items():
+        if field.alias == alias:
+            return name
+    return alias
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
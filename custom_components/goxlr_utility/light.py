@@ -1,43 +1,92 @@
 """Support for GoXLR Utility lights."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache, lru_cache
 import logging
-from typing import Any, cast
+from operator import attrgetter
+from typing import Any
 
 from goxlrutilityapi.const import KEY_MAP, NAME_MAP
 from goxlrutilityapi.models.map_item import MapItem
-
-from homeassistant.components.light import ATTR_RGB_COLOR, ColorMode, LightEntity
+from goxlrutilityapi.models.status import Buttons, Faders
+
+from homeassistant.components.light import (
+    ATTR_RGB_COLOR,
+    ColorMode,
+    LightEntity,
+    LightEntityDescription,
+)
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import homeassistant.util.color as color_util
 
-from .const import DOMAIN
+from .const import (
+    CONF_BUTTON_LIGHTS,
+    CONF_FADER_LIGHTS,
+    CONF_LIGHT_WRITE_INTERVAL,
+    DOMAIN,
+)
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
-from .entity import GoXLRUtilityEntity, GoXLRUtilityLightEntityDescription, ItemType
+from .entity import (
+    GoXLRUtilityEntity,
+    GoXLRUtilityEntityDescription,
+    async_get_enabled_descriptions,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up GoXLR Utility light based on a config entry."""
-    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+class ItemType(Enum):
+    """Enum for GoXLR Utility item types."""
+
+    ACCENT = "accent"
+    BUTTON_ACTIVE = "button_active"
+    BUTTON_INACTIVE = "button_inactive"
+    FADER_BOTTOM = "fader_bottom"
+    FADER_TOP = "fader_top"
+
+
+@dataclass
+class GoXLRUtilityLightEntityDescription(
+    GoXLRUtilityEntityDescription, LightEntityDescription
+):
+    """Class describing GoXLR Utility light entities."""
+
+    item_type: ItemType = ItemType.ACCENT
+    item_key: str = ""
+    value: Callable = round
+
+
+@lru_cache(maxsize=64)
+def hex_to_rgb(hex_value: str) -> tuple[int, int, int]:
+    """Convert a hex colour to an rgb tuple.
+
+    Profiles only use a handful of colours, so the tuples are shared.
+    """
+    red, green, blue = color_util.rgb_hex_to_rgb_list(hex_value)
+    return (red, green, blue)
+
 
+@cache
+def get_light_descriptions() -> tuple[GoXLRUtilityLightEntityDescription, ...]:
+    """Get the light descriptions, shared by all mixers."""
     light_descrpitions = [
         GoXLRUtilityLightEntityDescription(
             key="light_accent",
             name="Accent",
             icon="mdi:television-ambient-light",
             item_type=ItemType.ACCENT,
+            paths=(("lighting", "simple", "accent"),),
+            value=attrgetter("lighting.simple.accent.colour_one"),
         ),
     ]
 
-    for key in vars(coordinator.data.lighting.buttons):
+    for key in Buttons.__fields__:
         button_map_item: MapItem | None = NAME_MAP.get(key)
         light_descrpitions.extend(
             [
@@ -48,7 +97,10 @@ async def async_setup_entry(
                     if button_map_item and button_map_item.icon
                     else None,
                     item_type=ItemType.BUTTON_ACTIVE,
+                    group=CONF_BUTTON_LIGHTS,
+                    paths=(("lighting", "buttons", key),),
                     item_key=key,
+                    value=attrgetter(f"lighting.buttons.{key}.colours.colour_one"),
                 ),
                 GoXLRUtilityLightEntityDescription(
                     key=f"light_button_{key}_inactive",
@@ -57,12 +109,15 @@ async def async_setup_entry(
                     if button_map_item and button_map_item.icon
                     else None,
                     item_type=ItemType.BUTTON_INACTIVE,
+                    group=CONF_BUTTON_LIGHTS,
+                    paths=(("lighting", "buttons", key),),
                     item_key=key,
+                    value=attrgetter(f"lighting.buttons.{key}.colours.colour_two"),
                 ),
             ]
         )
 
-    for key in vars(coordinator.data.lighting.faders):
+    for key in Faders.__fields__:
         fader_map_item: MapItem | None = NAME_MAP.get(key)
         light_descrpitions.extend(
             [
@@ -73,7 +128,10 @@ async def async_setup_entry(
                     if fader_map_item and fader_map_item.icon
                     else None,
                     item_type=ItemType.FADER_TOP,
+                    group=CONF_FADER_LIGHTS,
+                    paths=(("lighting", "faders", key),),
                     item_key=key,
+                    value=attrgetter(f"lighting.faders.{key}.colours.colour_one"),
                 ),
                 GoXLRUtilityLightEntityDescription(
                     key=f"light_fader_{key}_bottom",
@@ -82,22 +140,34 @@ async def async_setup_entry(
                     if fader_map_item and fader_map_item.icon
                     else None,
                     item_type=ItemType.FADER_BOTTOM,
+                    group=CONF_FADER_LIGHTS,
+                    paths=(("lighting", "faders", key),),
                     item_key=key,
+                    value=attrgetter(f"lighting.faders.{key}.colours.colour_two"),
                 ),
             ]
         )
 
-    entities = []
-    for description in light_descrpitions:
-        entities.append(
-            GoXLRUtilityLight(
-                coordinator,
-                description,
-                entry.data.copy(),
-            )
-        )
+    return tuple(light_descrpitions)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up GoXLR Utility light based on a config entry."""
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(entities)
+    async_add_entities(
+        GoXLRUtilityLight(coordinator, description)
+        for description in async_get_enabled_descriptions(
+            hass,
+            coordinator,
+            Platform.LIGHT,
+            get_light_descriptions(),
+        )
+    )
 
 
 class GoXLRUtilityLight(GoXLRUtilityEntity, LightEntity):
@@ -106,21 +176,7 @@ class GoXLRUtilityLight(GoXLRUtilityEntity, LightEntity):
     _attr_color_mode = ColorMode.RGB
     _attr_supported_color_modes = {ColorMode.RGB}
     entity_description: GoXLRUtilityLightEntityDescription
-
-    def __init__(
-        self,
-        coordinator: GoXLRUtilityDataUpdateCoordinator,
-        description: GoXLRUtilityLightEntityDescription,
-        entry_data: dict[str, Any],
-    ) -> None:
-        """Initialize."""
-        super().__init__(
-            coordinator,
-            entry_data,
-            description.key,
-            description.name,
-        )
-        self.entity_description = description
+    _write_interval_option = CONF_LIGHT_WRITE_INTERVAL
 
     @property
     def is_on(self) -> bool:
@@ -130,132 +186,40 @@ class GoXLRUtilityLight(GoXLRUtilityEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         """Return the rgb color value [int, int, int]."""
-        hex_value: str | None = None
-        if self.entity_description.item_type == ItemType.ACCENT:
-            hex_value = self.coordinator.data.lighting.simple.accent.colour_one
-        elif self.entity_description.item_type == ItemType.BUTTON_ACTIVE:
-            item = getattr(
-                self.coordinator.data.lighting.buttons,
-                self.entity_description.item_key,
-            )
-            hex_value = item.colours.colour_one if item else None
-        elif self.entity_description.item_type == ItemType.BUTTON_INACTIVE:
-            item = getattr(
-                self.coordinator.data.lighting.buttons,
-                self.entity_description.item_key,
-            )
-            hex_value = item.colours.colour_two if item else None
-        elif self.entity_description.item_type == ItemType.FADER_TOP:
-            item = getattr(
-                self.coordinator.data.lighting.faders,
-                self.entity_description.item_key,
-            )
-            hex_value = item.colours.colour_one if item else None
-        elif self.entity_description.item_type == ItemType.FADER_BOTTOM:
-            item = getattr(
-                self.coordinator.data.lighting.faders,
-                self.entity_description.item_key,
+        try:
+            hex_value: str | None = self.entity_description.value(
+                self.coordinator.data
             )
-            hex_value = item.colours.colour_two if item else None
-
-        return (
-            cast(tuple[int, int, int], tuple(color_util.rgb_hex_to_rgb_list(hex_value)))
-            if hex_value
-            else None
-        )
+        except AttributeError:
+            # The mixer does not report the colours of every button and fader
+            return None
+        return hex_to_rgb(hex_value) if hex_value else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
-        if self.coordinator.client is None:
-            return
-
-        hex_value = color_util.color_rgb_to_hex(
-            *kwargs.get(ATTR_RGB_COLOR, (255, 255, 255))
+        self._set_colour(
+            color_util.color_rgb_to_hex(*kwargs.get(ATTR_RGB_COLOR, (255, 255, 255)))
         )
 
-        if self.entity_description.item_type == ItemType.ACCENT:
-            await self.coordinator.client.set_accent_color(hex_value)
-            return
-
-        item_key = self.entity_description.item_key
-        if (key := KEY_MAP.get(item_key)) is None:
-            return
-
-        if self.entity_description.item_type == ItemType.BUTTON_ACTIVE:
-            await self.coordinator.client.set_button_color(
-                key,
-                hex_value,
-                getattr(
-                    self.coordinator.data.lighting.buttons, item_key
-                ).colours.colour_two,
-            )
-        elif self.entity_description.item_type == ItemType.BUTTON_INACTIVE:
-            await self.coordinator.client.set_button_color(
-                key,
-                getattr(
-                    self.coordinator.data.lighting.buttons, item_key
-                ).colours.colour_one,
-                hex_value,
-            )
-        elif self.entity_description.item_type == ItemType.FADER_TOP:
-            await self.coordinator.client.set_fader_color(
-                key,
-                hex_value,
-                getattr(
-                    self.coordinator.data.lighting.faders, item_key
-                ).colours.colour_two,
-            )
-        elif self.entity_description.item_type == ItemType.FADER_BOTTOM:
-            await self.coordinator.client.set_fader_color(
-                key,
-                getattr(
-                    self.coordinator.data.lighting.faders, item_key
-                ).colours.colour_one,
-                hex_value,
-            )
-
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
-        if self.coordinator.client is None:
-            return
+        self._set_colour("000000")
 
+    def _set_colour(self, hex_value: str) -> None:
+        """Set the colour, keeping the other colour of the button or fader."""
         if self.entity_description.item_type == ItemType.ACCENT:
-            await self.coordinator.client.set_accent_color("000000")
+            self.coordinator.async_set_accent_colour(hex_value)
             return
 
         item_key = self.entity_description.item_key
-        if (key := KEY_MAP.get(item_key)) is None:
+        if item_key not in KEY_MAP:
             return
 
         if self.entity_description.item_type == ItemType.BUTTON_ACTIVE:
-            await self.coordinator.client.set_button_color(
-                key,
-                "000000",
-                getattr(
-                    self.coordinator.data.lighting.buttons, item_key
-                ).colours.colour_two,
-            )
+            self.coordinator.async_set_button_colours(item_key, colour_one=hex_value)
         elif self.entity_description.item_type == ItemType.BUTTON_INACTIVE:
-            await self.coordinator.client.set_button_color(
-                key,
-                getattr(
-                    self.coordinator.data.lighting.buttons, item_key
-                ).colours.colour_one,
-                "000000",
-            )
+            self.coordinator.async_set_button_colours(item_key, colour_two=hex_value)
         elif self.entity_description.item_type == ItemType.FADER_TOP:
-            await self.coordinator.client.set_fader_color(
-                key,
-                "000000",
-                getattr(
-                    self.coordinator.data.lighting.faders, item_key
-                ).colours.colour_two,
-            )
+            self.coordinator.async_set_fader_colours(item_key, colour_one=hex_value)
         elif self.entity_description.item_type == ItemType.FADER_BOTTOM:
-            await self.coordinator.client.set_fader_color(
-                key,
-                getattr(
-                    self.coordinator.data.lighting.faders, item_key
-                ).colours.colour_one,
-                "000000",
-            )
+            self.coordinator.async_set_fader_colours(item_key, colour_two=hex_value)
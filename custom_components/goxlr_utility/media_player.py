@@ -1,49 +1,76 @@
 """Support for GoXLR Utility media players."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
-from typing import Any
+from operator import attrgetter
+from typing import Final
 
-from goxlrutilityapi.const import MUTED_STATE, NAME_MAP
-from goxlrutilityapi.helpers import get_volume_percentage
+from goxlrutilityapi.const import MUTED_STATE, NAME_MAP, VOLUME_MAX
 from goxlrutilityapi.models.map_item import MapItem
-from goxlrutilityapi.models.status import FaderStatus, Mixer
-from goxlrutilityapi.websocket_client import WebsocketClient
+from goxlrutilityapi.models.status import Mixer, Volumes
 
 from homeassistant.components.media_player import (
     MediaPlayerDeviceClass,
     MediaPlayerEntity,
+    MediaPlayerEntityDescription,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import CONF_MEDIA_PLAYER_WRITE_INTERVAL, CONF_VOLUME_PLAYERS, DOMAIN
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
-from .entity import GoXLRUtilityEntity, GoXLRUtilityMediaPlayerEntityDescription
+from .entity import (
+    GoXLRUtilityEntity,
+    GoXLRUtilityEntityDescription,
+    async_get_enabled_descriptions,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_muted(
-    data: Mixer,
-    fader_key: str | None,
-) -> bool:
-    """Get muted state for a fader."""
+@dataclass
+class GoXLRUtilityMediaPlayerEntityDescription(
+    GoXLRUtilityEntityDescription, MediaPlayerEntityDescription
+):
+    """Class describing GoXLR Utility media player entities."""
+
+    can_mute: bool = False
+    muted_fn: Callable = round
+    volume_pct_fn: Callable = round
+    set_muted_fn: Callable = round
+    set_volume_fn: Callable = round
+
+
+# Volume percentage for every raw volume level
+VOLUME_PERCENTAGES: Final[tuple[int, ...]] = tuple(
+    round(volume / VOLUME_MAX * 100) for volume in range(VOLUME_MAX + 1)
+)
+
+
+def get_muted_fn(fader_key: str | None) -> Callable[[Mixer], bool]:
+    """Get a muted state accessor for a fader."""
     if fader_key is None:
-        return False
+        return lambda data: False
+
+    mute_state = attrgetter(f"fader_status.{fader_key}.mute_state")
+    return lambda data: mute_state(data) == MUTED_STATE
 
-    fader: FaderStatus = getattr(data.fader_status, fader_key)
-    if fader is None:
-        return False
 
-    return fader.mute_state == MUTED_STATE
+def get_volume_pct_fn(key: str) -> Callable[[Mixer], int]:
+    """Get a volume percentage accessor for a channel."""
+    volume = attrgetter(f"levels.volumes.{key}")
+    return lambda data: VOLUME_PERCENTAGES[volume(data)]
 
 
-async def set_muted(
-    client: WebsocketClient,
+def set_muted(
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
     fader_key: str | None,
     muted: bool,
 ) -> None:
@@ -51,14 +78,14 @@ async def set_muted(
     if fader_key is None:
         return
 
-    await client.set_muted(
+    coordinator.async_set_muted(
         fader_key.capitalize(),
         muted,
     )
 
 
-async def set_volume(
-    client: WebsocketClient,
+def set_volume(
+    coordinator: GoXLRUtilityDataUpdateCoordinator,
     map_item: MapItem | None,
     volume: float,
 ) -> None:
@@ -66,32 +93,32 @@ async def set_volume(
     if map_item is None:
         return
 
-    await client.set_volume(
+    coordinator.async_set_volume(
         map_item.key,
         int(volume * 2.55),
     )
 
 
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up GoXLR Utility media players based on a config entry."""
-    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+@lru_cache(maxsize=8)
+def get_media_player_descriptions(
+    fader_channels: tuple[str, str, str, str],
+) -> tuple[GoXLRUtilityMediaPlayerEntityDescription, ...]:
+    """Get the media player descriptions for the channels on faders A to D.
 
+    Mixers with the same channels on their faders share their descriptions.
+    """
     faders: dict[str, MapItem | None] = {
-        "a": NAME_MAP.get(coordinator.data.fader_status.a.channel),
-        "b": NAME_MAP.get(coordinator.data.fader_status.b.channel),
-        "c": NAME_MAP.get(coordinator.data.fader_status.c.channel),
-        "d": NAME_MAP.get(coordinator.data.fader_status.d.channel),
+        "a": NAME_MAP.get(fader_channels[0]),
+        "b": NAME_MAP.get(fader_channels[1]),
+        "c": NAME_MAP.get(fader_channels[2]),
+        "d": NAME_MAP.get(fader_channels[3]),
     }
 
     _LOGGER.debug("Faders: %s", faders)
 
     media_player_descrpitions: list[GoXLRUtilityMediaPlayerEntityDescription] = []
 
-    for key in vars(coordinator.data.levels.volumes):
+    for key in Volumes.__fields__:
         _LOGGER.debug("key: %s", key)
 
         # Get map item from map
@@ -111,53 +138,59 @@ async def async_setup_entry(
                 icon=map_item.icon if map_item else "mdi:volume-high",
                 device_class=MediaPlayerDeviceClass.SPEAKER,
                 can_mute=fader_key is not None,
-                muted_fn=lambda data, fader_key=fader_key: get_muted(data, fader_key),
-                volume_pct_fn=lambda data, key=key: get_volume_percentage(data, key),
-                set_muted_fn=lambda client, muted, fader_key=fader_key: set_muted(
-                    client,
+                paths=(("levels", "volumes", key),)
+                + ((("fader_status", fader_key),) if fader_key else ()),
+                group=CONF_VOLUME_PLAYERS,
+                muted_fn=get_muted_fn(fader_key),
+                volume_pct_fn=get_volume_pct_fn(key),
+                set_muted_fn=lambda coordinator, muted, fader_key=fader_key: set_muted(
+                    coordinator,
                     fader_key,
                     muted,
                 ),
-                set_volume_fn=lambda client, value, map_item=map_item: set_volume(
-                    client,
+                set_volume_fn=lambda coordinator, value, map_item=map_item: set_volume(
+                    coordinator,
                     map_item,
                     value,
                 ),
             )
         )
 
-    entities: list[GoXLRUtilityMediaPlayer] = []
-    for description in media_player_descrpitions:
-        entities.append(
-            GoXLRUtilityMediaPlayer(
-                coordinator,
-                description,
-                entry.data.copy(),
-            )
-        )
+    return tuple(media_player_descrpitions)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up GoXLR Utility media players based on a config entry."""
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(entities)
+    fader_status = coordinator.data.fader_status
+    async_add_entities(
+        GoXLRUtilityMediaPlayer(coordinator, description)
+        for description in async_get_enabled_descriptions(
+            hass,
+            coordinator,
+            Platform.MEDIA_PLAYER,
+            get_media_player_descriptions(
+                (
+                    fader_status.a.channel,
+                    fader_status.b.channel,
+                    fader_status.c.channel,
+                    fader_status.d.channel,
+                )
+            ),
+        )
+    )
 
 
 class GoXLRUtilityMediaPlayer(GoXLRUtilityEntity, MediaPlayerEntity):
     """Define a GoXLR Utility media_player."""
 
     entity_description: GoXLRUtilityMediaPlayerEntityDescription
-
-    def __init__(
-        self,
-        coordinator: GoXLRUtilityDataUpdateCoordinator,
-        description: GoXLRUtilityMediaPlayerEntityDescription,
-        entry_data: dict[str, Any],
-    ) -> None:
-        """Initialize."""
-        super().__init__(
-            coordinator,
-            entry_data,
-            description.key,
-            description.name,
-        )
-        self.entity_description = description
+    _write_interval_option = CONF_MEDIA_PLAYER_WRITE_INTERVAL
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
@@ -188,8 +221,8 @@ class GoXLRUtilityMediaPlayer(GoXLRUtilityEntity, MediaPlayerEntity):
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        await self.entity_description.set_muted_fn(
-            self.coordinator.client,
+        self.entity_description.set_muted_fn(
+            self.coordinator,
             mute,
         )
 
@@ -198,7 +231,7 @@ class GoXLRUtilityMediaPlayer(GoXLRUtilityEntity, MediaPlayerEntity):
         if self.is_volume_muted:
             await self.async_mute_volume(False)
 
-        await self.entity_description.set_volume_fn(
-            self.coordinator.client,
+        self.entity_description.set_volume_fn(
+            self.coordinator,
             volume * 100,
         )
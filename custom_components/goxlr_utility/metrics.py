@@ -0,0 +1,231 @@
+"""Metrics for GoXLR Utility integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+import math
+import time
+
+from .const import (
+    LATENCY_BUCKETS,
+    PATCH_BATCH_SIZE_BUCKETS,
+    RATE_WINDOW,
+    ROLLING_PERCENTILE_SIZE,
+)
+
+
+class Histogram:
+    """Fixed-size bucketed histogram."""
+
+    __slots__ = ("_bounds", "_counts", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram with the upper bounds of its buckets."""
+        self._bounds = bounds
+        # The last bucket holds values above the last bound
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    @property
+    def buckets(self) -> dict[str, int]:
+        """Return the counts of each bucket by its upper bound."""
+        buckets = {
+            str(bound): count for bound, count in zip(self._bounds, self._counts)
+        }
+        buckets["inf"] = self._counts[-1]
+        return buckets
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the recorded values."""
+        return self.total / self.count if self.count else None
+
+    def record(self, value: float) -> None:
+        """Record a value."""
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the upper bound of the bucket holding the percentile.
+
+        A percentile in the last bucket has no upper bound and is infinite.
+        """
+        if not self.count:
+            return None
+
+        rank = math.ceil(self.count * percentile / 100)
+        cumulative = 0
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return math.inf
+
+
+class RollingPercentiles:
+    """Exact percentiles of the most recent values."""
+
+    __slots__ = ("_values",)
+
+    def __init__(self, size: int = ROLLING_PERCENTILE_SIZE) -> None:
+        """Initialize with the number of recent values to keep."""
+        self._values: deque[float] = deque(maxlen=size)
+
+    @property
+    def count(self) -> int:
+        """Return the number of values kept."""
+        return len(self._values)
+
+    def record(self, value: float) -> None:
+        """Record a value, dropping the oldest one when full."""
+        self._values.append(value)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Return the nearest rank percentile of the kept values."""
+        if not self._values:
+            return None
+
+        values = sorted(self._values)
+        rank = max(1, math.ceil(len(values) * percentile / 100))
+        return values[rank - 1]
+
+
+class RateCounter:
+    """Event rate over a sliding window of one second slots."""
+
+    __slots__ = ("_counts", "_seconds")
+
+    def __init__(self, window: int = RATE_WINDOW) -> None:
+        """Initialize the rate counter."""
+        self._counts = [0] * window
+        self._seconds = [0] * window
+
+    def record(self, count: int = 1) -> None:
+        """Record events happening now."""
+        second = int(time.monotonic())
+        index = second % len(self._seconds)
+        if self._seconds[index] != second:
+            self._seconds[index] = second
+            self._counts[index] = 0
+        self._counts[index] += count
+
+    @property
+    def rate(self) -> float:
+        """Return the events per second over the window."""
+        window = len(self._seconds)
+        oldest = int(time.monotonic()) - window
+        return (
+            sum(
+                count
+                for second, count in zip(self._seconds, self._counts)
+                if second > oldest
+            )
+            / window
+        )
+
+
+def latency_histogram() -> Histogram:
+    """Create a histogram for latencies in milliseconds."""
+    return Histogram(LATENCY_BUCKETS)
+
+
+@dataclass
+class PatchBatchStatistics:
+    """Counters for patch batches applied by the coordinator."""
+
+    batches: int = 0
+    patches: int = 0
+    largest: int = 0
+    dropped: int = 0
+    size_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(PATCH_BATCH_SIZE_BUCKETS) + 1)
+    )
+
+    @property
+    def average(self) -> float:
+        """Return the average batch size."""
+        return self.patches / self.batches if self.batches else 0.0
+
+    def record(self, size: int) -> None:
+        """Record a batch of the given size."""
+        self.batches += 1
+        self.patches += size
+        self.largest = max(self.largest, size)
+        self.size_buckets[bisect_left(PATCH_BATCH_SIZE_BUCKETS, size)] += 1
+
+
+@dataclass
+class ReconnectStatistics:
+    """Counters for reconnects to GoXLR Utility."""
+
+    attempts: int = 0
+    reconnects: int = 0
+    last_attempts: int = 0
+    last_recovery_time: float | None = None
+
+    def record(self, attempts: int, recovery_time: float) -> None:
+        """Record a successful reconnect."""
+        self.reconnects += 1
+        self.last_attempts = attempts
+        self.last_recovery_time = recovery_time
+
+
+@dataclass
+class CommandStatistics:
+    """Counters for commands sent to GoXLR Utility."""
+
+    scheduled: int = 0
+    sent: int = 0
+    # Commands replaced by a newer command for the same target before sending
+    coalesced: int = 0
+    failed: int = 0
+    # Optimistic values the device confirmed or that were rolled back
+    confirmed: int = 0
+    rolled_back: int = 0
+
+
+@dataclass
+class StateWriteStatistics:
+    """Counters for state writes of the entities."""
+
+    written: int = 0
+    # Writes held back until the end of the write interval of the entity
+    throttled: int = 0
+    # Writes left out because the entity would show the same as before
+    skipped: int = 0
+
+
+@dataclass
+class PatchPipelineMetrics:
+    """Timings of the patch pipeline, in milliseconds."""
+
+    patch_rate: RateCounter = field(default_factory=RateCounter)
+    # Time spent in the websocket patch callback
+    callback_time: Histogram = field(default_factory=latency_histogram)
+    # Time to resolve the patch path to attribute names
+    resolve_time: Histogram = field(default_factory=latency_histogram)
+    # Time to set the patched value in the data
+    set_time: Histogram = field(default_factory=latency_histogram)
+    # Time from receiving a patch to having applied it
+    apply_latency: Histogram = field(default_factory=latency_histogram)
+    # Time spent calling back listeners after a batch
+    listener_time: Histogram = field(default_factory=latency_histogram)
+    # Time from sending a command to the daemon replying to it
+    command_time: Histogram = field(default_factory=latency_histogram)
+
+
+@dataclass
+class RoundTripMetrics:
+    """Round trips to GoXLR Utility, in milliseconds."""
+
+    # Time from sending a ping to the daemon replying to it
+    probe_time: RollingPercentiles = field(default_factory=RollingPercentiles)
+    # Time from issuing a command to receiving the patch of the value it sets
+    command_echo_time: RollingPercentiles = field(default_factory=RollingPercentiles)
+    probes: int = 0
+    failed_probes: int = 0
+    # Seconds until the next ping, grows while the connection is idle
+    probe_interval: float | None = None
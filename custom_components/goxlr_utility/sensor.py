@@ -1,18 +1,190 @@
 """Support for GoXLR Utility sensors."""
 from __future__ import annotations
 
-from typing import Any, cast
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from itertools import product
+import math
+from typing import Any, Final, cast
 
-from homeassistant.components.sensor import SensorEntity
+from goxlrutilityapi.models.status import Router, RouterItem
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, Platform, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import StateType
 
-from .const import DOMAIN
+from .const import (
+    ATTR_INPUTS,
+    ATTR_OUTPUTS,
+    CONF_DIAGNOSTICS,
+    CONF_ROUTING,
+    DOMAIN,
+    METRICS_UPDATE_INTERVAL,
+)
 from .coordinator import GoXLRUtilityDataUpdateCoordinator
-from .entity import GoXLRUtilityEntity, GoXLRUtilitySensorEntityDescription
+from .entity import (
+    GoXLRUtilityEntity,
+    GoXLRUtilityEntityDescription,
+    async_get_enabled_descriptions,
+)
+
+
+@dataclass
+class GoXLRUtilitySensorEntityDescription(
+    GoXLRUtilityEntityDescription, SensorEntityDescription
+):
+    """Class describing GoXLR Utility sensor entities."""
+
+    value: Callable = round
+
+
+# Inputs and outputs in the bit order of the routing bitmask
+ROUTER_INPUTS: Final[tuple[str, ...]] = tuple(Router.__fields__)
+ROUTER_OUTPUTS: Final[tuple[str, ...]] = tuple(RouterItem.__fields__)
+
+
+def get_routing_bitmask(router: Router) -> int:
+    """Pack the routing table into a bitmask.
+
+    Bit ``input_index * len(ROUTER_OUTPUTS) + output_index`` is set when
+    the input is routed to the output.
+    """
+    bitmask = 0
+    for bit, (router_input, router_output) in enumerate(
+        product(ROUTER_INPUTS, ROUTER_OUTPUTS)
+    ):
+        item: RouterItem | None = getattr(router, router_input)
+        if item is not None and getattr(item, router_output):
+            bitmask |= 1 << bit
+    return bitmask
+
+
+SENSOR_DESCRIPTIONS: tuple[GoXLRUtilitySensorEntityDescription, ...] = (
+    GoXLRUtilitySensorEntityDescription(
+        key="profile_name",
+        name="Profile name",
+        icon="mdi:headphones-settings",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_visible_default=False,
+        paths=(("profile_name",),),
+        value=lambda data: data.profile_name,
+    ),
+    GoXLRUtilitySensorEntityDescription(
+        key="microphone_profile_name",
+        name="Microphone profile name",
+        icon="mdi:microphone-settings",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_visible_default=False,
+        paths=(("mic_profile_name",),),
+        value=lambda data: data.mic_profile_name,
+    ),
+)
+
+ROUTING_SENSOR_DESCRIPTION = GoXLRUtilitySensorEntityDescription(
+    key="routing",
+    name="Routing",
+    icon="mdi:transit-connection-variant",
+    group=CONF_ROUTING,
+    value=lambda data: get_routing_bitmask(data.router),
+)
+
+METRIC_SENSOR_DESCRIPTIONS: tuple[GoXLRUtilitySensorEntityDescription, ...] = (
+    GoXLRUtilitySensorEntityDescription(
+        key="patch_rate",
+        name="Patch rate",
+        icon="mdi:speedometer",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        group=CONF_DIAGNOSTICS,
+        native_unit_of_measurement="patches/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator: round(coordinator.metrics.patch_rate.rate, 1),
+    ),
+    *(
+        GoXLRUtilitySensorEntityDescription(
+            key=f"patch_apply_latency_p{percentile}",
+            name=f"Patch apply latency p{percentile}",
+            icon="mdi:timer-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            group=CONF_DIAGNOSTICS,
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            value=lambda coordinator, percentile=percentile: (
+                coordinator.metrics.apply_latency.percentile(percentile)
+            ),
+        )
+        for percentile in (50, 95, 99)
+    ),
+    GoXLRUtilitySensorEntityDescription(
+        key="listener_time_p95",
+        name="Listener callback time p95",
+        icon="mdi:timer-outline",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        group=CONF_DIAGNOSTICS,
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value=lambda coordinator: coordinator.metrics.listener_time.percentile(95),
+    ),
+    *(
+        GoXLRUtilitySensorEntityDescription(
+            key=f"{key}_p{percentile}",
+            name=f"{name} p{percentile}",
+            icon="mdi:timer-outline",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+            group=CONF_DIAGNOSTICS,
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
+            value=lambda coordinator, attribute=attribute, percentile=percentile: (
+                getattr(coordinator.round_trip_metrics, attribute).percentile(
+                    percentile
+                )
+            ),
+        )
+        for key, name, attribute in (
+            ("round_trip_time", "Round trip time", "probe_time"),
+            ("command_echo_time", "Command echo time", "command_echo_time"),
+        )
+        for percentile in (50, 95)
+    ),
+    GoXLRUtilitySensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        icon="mdi:lan-connect",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        group=CONF_DIAGNOSTICS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda coordinator: coordinator.reconnect_statistics.reconnects,
+    ),
+    GoXLRUtilitySensorEntityDescription(
+        key="commands_coalesced",
+        name="Commands coalesced",
+        icon="mdi:call-merge",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        group=CONF_DIAGNOSTICS,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value=lambda coordinator: coordinator.command_statistics.coalesced,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -23,33 +195,28 @@ async def async_setup_entry(
     """Set up GoXLR Utility sensor based on a config entry."""
     coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    sensor_descriptions: list[GoXLRUtilitySensorEntityDescription] = [
-        GoXLRUtilitySensorEntityDescription(
-            key="profile_name",
-            name="Profile name",
-            icon="mdi:headphones-settings",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_visible_default=False,
-            value=lambda data: data.profile_name,
-        ),
-        GoXLRUtilitySensorEntityDescription(
-            key="microphone_profile_name",
-            name="Microphone profile name",
-            icon="mdi:microphone-settings",
-            entity_category=EntityCategory.DIAGNOSTIC,
-            entity_registry_visible_default=False,
-            value=lambda data: data.mic_profile_name,
-        ),
+    entities: list[GoXLRUtilitySensor] = [
+        GoXLRUtilitySensor(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
     ]
-
-    entities = [
-        GoXLRUtilitySensor(
+    entities.extend(
+        GoXLRUtilityRoutingSensor(coordinator, description)
+        for description in async_get_enabled_descriptions(
+            hass,
             coordinator,
-            description,
-            entry.data.copy(),
+            Platform.SENSOR,
+            (ROUTING_SENSOR_DESCRIPTION,),
         )
-        for description in sensor_descriptions
-    ]
+    )
+    entities.extend(
+        GoXLRUtilityMetricSensor(coordinator, description)
+        for description in async_get_enabled_descriptions(
+            hass,
+            coordinator,
+            Platform.SENSOR,
+            METRIC_SENSOR_DESCRIPTIONS,
+        )
+    )
     async_add_entities(entities)
 
 
@@ -58,25 +225,107 @@ class GoXLRUtilitySensor(GoXLRUtilityEntity, SensorEntity):
 
     entity_description: GoXLRUtilitySensorEntityDescription
 
+    @property
+    def native_value(self) -> StateType:
+        """Return the state."""
+        try:
+            return cast(StateType, self.entity_description.value(self.coordinator.data))
+        except TypeError:
+            return None
+
+
+class GoXLRUtilityRoutingSensor(GoXLRUtilitySensor):
+    """Define a GoXLR Utility sensor holding the routing table as a bitmask.
+
+    Every route has a path listener of its own, so a patch to a route flips
+    its bit instead of packing the whole table again.
+    """
+
     def __init__(
         self,
         coordinator: GoXLRUtilityDataUpdateCoordinator,
         description: GoXLRUtilitySensorEntityDescription,
-        entry_data: dict[str, Any],
     ) -> None:
-        """Initialize."""
-        super().__init__(
-            coordinator,
-            entry_data,
-            description.key,
-            description.name,
+        """Initialize the GoXLR Utility routing sensor."""
+        super().__init__(coordinator, description)
+        self._bitmask: int = description.value(coordinator.data)
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        for bit, (router_input, router_output) in enumerate(
+            product(ROUTER_INPUTS, ROUTER_OUTPUTS)
+        ):
+            self.async_on_remove(
+                self.coordinator.async_add_path_listener(
+                    ("router", router_input, router_output),
+                    partial(
+                        self._async_route_patched, router_input, router_output, bit
+                    ),
+                )
+            )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pack the routing table again after the data was replaced."""
+        self._bitmask = self.entity_description.value(self.coordinator.data)
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_route_patched(
+        self,
+        router_input: str,
+        router_output: str,
+        bit: int,
+    ) -> None:
+        """Set or clear the bit of a patched route."""
+        item: RouterItem | None = getattr(self.coordinator.data.router, router_input)
+        if item is not None and getattr(item, router_output):
+            self._bitmask |= 1 << bit
+        else:
+            self._bitmask &= ~(1 << bit)
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state."""
+        return self._bitmask
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the state attributes."""
+        return {
+            **(super().extra_state_attributes or {}),
+            ATTR_INPUTS: ROUTER_INPUTS,
+            ATTR_OUTPUTS: ROUTER_OUTPUTS,
+        }
+
+
+class GoXLRUtilityMetricSensor(GoXLRUtilitySensor):
+    """Define a GoXLR Utility metric sensor."""
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        # Metrics change with every patch, so update on an interval instead
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_update_metrics,
+                timedelta(seconds=METRICS_UPDATE_INTERVAL),
+            )
         )
-        self.entity_description = description
+
+    @callback
+    def _async_update_metrics(self, _: datetime) -> None:
+        """Update the metric state."""
+        self._handle_coordinator_update()
 
     @property
     def native_value(self) -> StateType:
         """Return the state."""
-        try:
-            return cast(StateType, self.entity_description.value(self.coordinator.data))
-        except TypeError:
+        value = self.entity_description.value(self.coordinator)
+        # Percentiles above the last histogram bucket have no known value
+        if isinstance(value, float) and math.isinf(value):
             return None
+        return cast(StateType, value)
@@ -0,0 +1,138 @@
+"""Services for GoXLR Utility integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from goxlrutilityapi.models.status import Buttons, Faders, Router, RouterItem
+import voluptuous as vol
+
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_ACCENT,
+    ATTR_ACTIVE,
+    ATTR_BOTTOM,
+    ATTR_BUTTONS,
+    ATTR_FADERS,
+    ATTR_INACTIVE,
+    ATTR_ROUTES,
+    ATTR_TOP,
+    DOMAIN,
+    SERVICE_SET_LIGHTING,
+    SERVICE_SET_ROUTING,
+)
+from .coordinator import GoXLRUtilityDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+COLOUR_SCHEMA = vol.All(
+    vol.Coerce(tuple),
+    vol.ExactSequence((cv.byte, cv.byte, cv.byte)),
+)
+
+SET_LIGHTING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_ACCENT): COLOUR_SCHEMA,
+        vol.Optional(ATTR_BUTTONS, default={}): {
+            vol.In(list(Buttons.__fields__)): {
+                vol.Optional(ATTR_ACTIVE): COLOUR_SCHEMA,
+                vol.Optional(ATTR_INACTIVE): COLOUR_SCHEMA,
+            }
+        },
+        vol.Optional(ATTR_FADERS, default={}): {
+            vol.In(list(Faders.__fields__)): {
+                vol.Optional(ATTR_TOP): COLOUR_SCHEMA,
+                vol.Optional(ATTR_BOTTOM): COLOUR_SCHEMA,
+            }
+        },
+    }
+)
+
+SET_ROUTING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_ROUTES): {
+            vol.In(list(Router.__fields__)): {
+                vol.In(list(RouterItem.__fields__)): cv.boolean,
+            }
+        },
+    }
+)
+
+
+def _get_hex(rgb: tuple[int, int, int] | None) -> str | None:
+    """Get the hex value for an rgb colour."""
+    # Only needed once the service is called, keeping it off the setup path
+    import homeassistant.util.color as color_util  # pylint: disable=import-outside-toplevel
+
+    return color_util.color_rgb_to_hex(*rgb) if rgb is not None else None
+
+
+def _get_coordinator(
+    hass: HomeAssistant,
+    device_id: str,
+) -> GoXLRUtilityDataUpdateCoordinator:
+    """Get the coordinator for a device."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        raise HomeAssistantError(f"Device {device_id} not found")
+
+    coordinators: dict[str, Any] = hass.data.get(DOMAIN, {})
+    for entry_id in device.config_entries:
+        if (coordinator := coordinators.get(entry_id)) is not None:
+            return coordinator
+
+    raise HomeAssistantError(f"Device {device_id} is not a loaded GoXLR")
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for GoXLR Utility integration."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_LIGHTING):
+        return
+
+    async def handle_set_lighting(call: ServiceCall) -> None:
+        """Handle the set lighting service call."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        commands = coordinator.async_set_lighting(
+            _get_hex(call.data.get(ATTR_ACCENT)),
+            {
+                key: (
+                    _get_hex(colours.get(ATTR_ACTIVE)),
+                    _get_hex(colours.get(ATTR_INACTIVE)),
+                )
+                for key, colours in call.data[ATTR_BUTTONS].items()
+            },
+            {
+                key: (
+                    _get_hex(colours.get(ATTR_TOP)),
+                    _get_hex(colours.get(ATTR_BOTTOM)),
+                )
+                for key, colours in call.data[ATTR_FADERS].items()
+            },
+        )
+        _LOGGER.debug("Scheduled %s lighting commands", commands)
+
+    async def handle_set_routing(call: ServiceCall) -> None:
+        """Handle the set routing service call."""
+        coordinator = _get_coordinator(hass, call.data[ATTR_DEVICE_ID])
+        commands = coordinator.async_set_routing(call.data[ATTR_ROUTES])
+        _LOGGER.debug("Scheduled %s routing commands", commands)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_LIGHTING,
+        handle_set_lighting,
+        schema=SET_LIGHTING_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ROUTING,
+        handle_set_routing,
+        schema=SET_ROUTING_SCHEMA,
+    )
@@ -1 +1,58 @@
 """Tests for the GoXLR Utility integration."""
+import asyncio
+from typing import Any
+
+from homeassistant import config_entries
+from homeassistant.components.goxlr_utility.const import DOMAIN
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant
+
+from .fake_utility import FakeGoXLRUtility
+
+
+async def setup_integration(
+    hass: HomeAssistant, fake_utility: FakeGoXLRUtility
+) -> ConfigEntry:
+    """Set up the integration through the config flow."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={
+            "source": config_entries.SOURCE_USER,
+        },
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_HOST: fake_utility.host,
+            CONF_PORT: fake_utility.port,
+        },
+    )
+    await hass.async_block_till_done()
+    assert "result" in result
+    return result["result"]
+
+
+async def wait_for_commands(fake_utility: FakeGoXLRUtility, count: int) -> None:
+    """Wait for the daemon to receive a number of commands."""
+    async with asyncio.timeout(5):
+        while len(fake_utility.commands) < count:
+            await asyncio.sleep(0.01)
+
+
+async def set_options(
+    hass: HomeAssistant, entry: ConfigEntry, options: dict[str, Any]
+) -> None:
+    """Set options through the options flow and wait for the reload."""
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], options
+    )
+    await hass.async_block_till_done()
+    assert "data" in result
+
+    # The reloaded entry shows its last known mixer until it is connected
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    async with asyncio.timeout(5):
+        while coordinator.stale:
+            await asyncio.sleep(0.01)
@@ -1,9 +1,11 @@
 """Common fixtures for the GoXLR Utility tests."""
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from .fake_utility import FakeGoXLRUtility
+
 
 @pytest.fixture
 def mock_setup_entry() -> Generator[AsyncMock, None, None]:
@@ -12,3 +14,14 @@ def mock_setup_entry() -> Generator[AsyncMock, None, None]:
         "homeassistant.components.goxlr_utility.async_setup_entry", return_value=True
     ) as mock_setup_entry:
         yield mock_setup_entry
+
+
+@pytest.fixture
+async def fake_utility(
+    socket_enabled: None,
+) -> AsyncGenerator[FakeGoXLRUtility, None]:
+    """Run a local GoXLR Utility daemon."""
+    utility = FakeGoXLRUtility()
+    await utility.start()
+    yield utility
+    await utility.stop()
@@ -0,0 +1,409 @@
+"""Local stand-in for the GoXLR Utility daemon used by the tests."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from copy import deepcopy
+from typing import Any, Final
+
+from aiohttp import WSMsgType, web
+
+FIXTURE_SERIAL: Final[str] = "S210500001AB"
+
+BUTTONS: Final[tuple[str, ...]] = (
+    "Bleep",
+    "Cough",
+    "Fader1Mute",
+    "Fader2Mute",
+    "Fader3Mute",
+    "Fader4Mute",
+)
+BUTTONS_DOWN: Final[tuple[str, ...]] = (
+    "Bleep",
+    "Cough",
+    "EffectFx",
+    "EffectHardTune",
+    "EffectMegaphone",
+    "EffectRobot",
+    "EffectSelect1",
+    "EffectSelect2",
+    "EffectSelect3",
+    "EffectSelect4",
+    "EffectSelect5",
+    "EffectSelect6",
+    "Fader1Mute",
+    "Fader2Mute",
+    "Fader3Mute",
+    "Fader4Mute",
+    "SamplerBottomLeft",
+    "SamplerBottomRight",
+    "SamplerClear",
+    "SamplerSelectA",
+    "SamplerSelectB",
+    "SamplerSelectC",
+    "SamplerTopLeft",
+    "SamplerTopRight",
+)
+CHANNELS: Final[tuple[str, ...]] = (
+    "Mic",
+    "LineIn",
+    "Console",
+    "System",
+    "Game",
+    "Chat",
+    "Sample",
+    "Music",
+    "Headphones",
+    "MicMonitor",
+    "LineOut",
+)
+FADERS: Final[dict[str, str]] = {
+    "A": "Mic",
+    "B": "Music",
+    "C": "Chat",
+    "D": "System",
+}
+INPUTS: Final[tuple[str, ...]] = (
+    "Microphone",
+    "Chat",
+    "Music",
+    "Game",
+    "Console",
+    "LineIn",
+    "System",
+    "Samples",
+)
+OUTPUTS: Final[tuple[str, ...]] = (
+    "Headphones",
+    "BroadcastMix",
+    "ChatMic",
+    "Sampler",
+    "LineOut",
+)
+
+
+def build_mixer(serial: str = FIXTURE_SERIAL) -> dict[str, Any]:
+    """Build a mixer as reported by a full size GoXLR."""
+    return {
+        "hardware": {
+            "versions": {
+                "firmware": [1, 4, 2, 107],
+                "fpga_count": 21,
+                "dice": [1, 0, 4, 0],
+            },
+            "serial_number": serial,
+            "manufactured_date": "2021-05-06",
+            "device_type": "Full",
+            "usb_device": {
+                "manufacturer_name": "TC-Helicon",
+                "product_name": "GoXLR",
+                "version": [1, 0, 16],
+                "bus_number": 1,
+                "address": 5,
+                "identifier": "1-5",
+            },
+        },
+        "shutdown_commands": [],
+        "fader_status": {
+            fader: {
+                "channel": channel,
+                "mute_type": "All",
+                "scribble": None,
+                "mute_state": "Unmuted",
+            }
+            for fader, channel in FADERS.items()
+        },
+        "mic_status": {
+            "mic_type": "Dynamic",
+            "mic_gains": {"Dynamic": 40, "Condenser": 30, "Jack": 30},
+            "noise_gate": {
+                "threshold": -30,
+                "attack": 10,
+                "release": 15,
+                "enabled": True,
+                "attenuation": 100,
+            },
+            "compressor": {
+                "threshold": -20,
+                "ratio": 3,
+                "attack": 5,
+                "release": 10,
+                "makeup_gain": 0,
+            },
+        },
+        "levels": {
+            "submix_supported": False,
+            "output_monitor": "Headphones",
+            "volumes": {channel: 191 for channel in CHANNELS},
+            "submix": None,
+            "bleep": -20,
+            "deess": 0,
+        },
+        "router": {
+            router_input: {router_output: True for router_output in OUTPUTS}
+            for router_input in INPUTS
+        },
+        "cough_button": {"is_toggle": False, "mute_type": "All", "state": "Unmuted"},
+        "lighting": {
+            "animation": {
+                "supported": True,
+                "mode": "None",
+                "mod1": 0,
+                "mod2": 0,
+                "waterfall_direction": "Down",
+            },
+            "faders": {
+                fader: {
+                    "style": "Gradient",
+                    "colours": {"colour_one": "00FFFF", "colour_two": "FF00FF"},
+                }
+                for fader in FADERS
+            },
+            "buttons": {
+                button: {
+                    "off_style": "Dimmed",
+                    "colours": {"colour_one": "00FFFF", "colour_two": "000000"},
+                }
+                for button in BUTTONS
+            },
+            "simple": {
+                "Global": {"colour_one": "00FFFF"},
+                "Accent": {"colour_one": "00FFFF"},
+            },
+            "sampler": {},
+            "encoders": {},
+        },
+        # Not modelled by goxlrutilityapi, kept as plain dicts
+        "effects": {"is_enabled": False, "active_preset": "Preset1"},
+        "sampler": {"record_buffer": 0, "banks": {}},
+        "settings": {
+            "display": {
+                "gate": "Simple",
+                "compressor": "Simple",
+                "equaliser": "Simple",
+                "equaliser_fine": "Simple",
+            },
+            "mute_hold_duration": 500,
+            "vc_mute_also_mute_cm": True,
+        },
+        "button_down": {button: False for button in BUTTONS_DOWN},
+        "profile_name": "Default",
+        "mic_profile_name": "Default",
+    }
+
+
+def build_status(*serials: str) -> dict[str, Any]:
+    """Build a status payload with the given mixers, or a single mixer."""
+    return {
+        "config": {
+            "daemon_version": "1.0.0",
+            "autostart_enabled": True,
+            "show_tray_icon": True,
+            "tts_enabled": False,
+            "allow_network_access": True,
+            "log_level": "Info",
+        },
+        "mixers": {
+            serial: build_mixer(serial) for serial in serials or (FIXTURE_SERIAL,)
+        },
+        "paths": {
+            "profile_directory": "/goxlr/profiles",
+            "mic_profile_directory": "/goxlr/mic-profiles",
+            "samples_directory": "/goxlr/samples",
+            "presets_directory": "/goxlr/presets",
+            "icons_directory": "/goxlr/icons",
+        },
+        "files": {
+            "profiles": ["Default", "Streaming"],
+            "mic_profiles": ["Default"],
+            "presets": [],
+            "samples": {},
+            "icons": [],
+        },
+    }
+
+
+def replace(path: str, value: Any, serial: str = FIXTURE_SERIAL) -> dict[str, Any]:
+    """Build a replace patch operation for a mixer path."""
+    return {"op": "replace", "path": f"/mixers/{serial}{path}", "value": value}
+
+
+def fader_sweep(channel: str = "Mic", steps: int = 256) -> list[list[dict]]:
+    """Build patch messages for moving a fader through its whole range."""
+    return [
+        [replace(f"/levels/volumes/{channel}", step % 256)] for step in range(steps)
+    ]
+
+
+def profile_switch(colour: str = "FF0000", volume: int = 127) -> list[list[dict]]:
+    """Build the patch message for loading a profile."""
+    patches = [replace("/profile_name", "Streaming")]
+    for channel in CHANNELS:
+        patches.append(replace(f"/levels/volumes/{channel}", volume))
+    for button in BUTTONS:
+        patches.append(
+            replace(f"/lighting/buttons/{button}/colours/colour_one", colour)
+        )
+        patches.append(
+            replace(f"/lighting/buttons/{button}/colours/colour_two", colour)
+        )
+    for fader in FADERS:
+        patches.append(replace(f"/lighting/faders/{fader}/colours/colour_one", colour))
+        patches.append(replace(f"/lighting/faders/{fader}/colours/colour_two", colour))
+    patches.append(replace("/lighting/simple/Accent/colour_one", colour))
+    return [patches]
+
+
+def button_mash(button: str = "Cough", presses: int = 50) -> list[list[dict]]:
+    """Build patch messages for repeatedly pressing a button."""
+    return [
+        [replace(f"/button_down/{button}", pressed)]
+        for _ in range(presses)
+        for pressed in (True, False)
+    ]
+
+
+class FakeGoXLRUtility:
+    """Websocket server speaking the GoXLR Utility protocol."""
+
+    def __init__(self, status: dict[str, Any] | None = None) -> None:
+        """Initialize the fake daemon."""
+        self.status = status or build_status()
+        self.commands: list[Any] = []
+        # Number of client connections, status requests and pings served
+        self.connections = 0
+        self.pings = 0
+        self.status_requests = 0
+        # Whether commands are echoed back as patches like the real daemon
+        self.echo_commands = True
+        # Seconds to take before replying to a command
+        self.reply_delay = 0.0
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+        self._reply_tasks: set[asyncio.Task] = set()
+        self._websockets: set[web.WebSocketResponse] = set()
+
+    async def start(self) -> None:
+        """Start serving on a free local port, or the same one on restart."""
+        app = web.Application()
+        app.router.add_get("/api/websocket", self._handle_websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Close all connections and stop serving."""
+        for task in self._reply_tasks:
+            task.cancel()
+        await self.disconnect_clients()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def disconnect_clients(self) -> None:
+        """Close all client connections."""
+        for websocket in list(self._websockets):
+            await websocket.close()
+
+    async def send_patches(self, messages: Iterable[list[dict]]) -> int:
+        """Send patch messages to all clients and return the patch count."""
+        count = 0
+        for patches in messages:
+            for patch in patches:
+                self._apply(patch)
+            count += len(patches)
+            for websocket in list(self._websockets):
+                await websocket.send_json({"data": {"Patch": patches}})
+            # Give the clients a chance to read, like a real socket would
+            await asyncio.sleep(0)
+        return count
+
+    def _apply(self, patch: dict[str, Any]) -> None:
+        """Apply a patch operation to the status."""
+        *parents, name = patch["path"].strip("/").split("/")
+        current = self.status
+        for parent in parents:
+            current = current[parent]
+        current[name] = deepcopy(patch["value"])
+
+    def _command_patches(self, serial: str, command: dict[str, Any]) -> list[dict]:
+        """Build the patches resulting from a command."""
+        (command_type, args), *_ = command.items()
+        if command_type == "SetVolume":
+            channel, volume = args
+            return [replace(f"/levels/volumes/{channel}", volume, serial)]
+        if command_type == "SetFaderMuteState":
+            fader, state = args
+            return [replace(f"/fader_status/{fader}/mute_state", state, serial)]
+        if command_type in ("SetButtonColours", "SetFaderColours"):
+            name, colour_one, colour_two = args
+            group = "buttons" if command_type == "SetButtonColours" else "faders"
+            path = f"/lighting/{group}/{name}/colours"
+            return [
+                replace(f"{path}/colour_one", colour_one, serial),
+                replace(f"{path}/colour_two", colour_two, serial),
+            ]
+        if command_type == "SetSimpleColour":
+            target, colour = args
+            return [replace(f"/lighting/simple/{target}/colour_one", colour, serial)]
+        if command_type == "SetRouter":
+            router_input, router_output, enabled = args
+            return [replace(f"/router/{router_input}/{router_output}", enabled, serial)]
+        return []
+
+    async def _reply_command(
+        self,
+        websocket: web.WebSocketResponse,
+        message_id: int,
+        serial: str,
+        command: dict[str, Any],
+    ) -> None:
+        """Reply to a command and echo its changes."""
+        if self.reply_delay:
+            await asyncio.sleep(self.reply_delay)
+        if websocket.closed:
+            return
+        await websocket.send_json({"id": message_id, "data": "Ok"})
+        if self.echo_commands and (patches := self._command_patches(serial, command)):
+            await self.send_patches([patches])
+
+    async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """Handle a client connection."""
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self._websockets.add(websocket)
+        self.connections += 1
+        try:
+            async for message in websocket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                request_data = message.json()
+                message_id = request_data.get("id")
+                data = request_data["data"]
+                if data == "GetStatus":
+                    self.status_requests += 1
+                    await websocket.send_json(
+                        {"id": message_id, "data": {"Status": self.status}}
+                    )
+                    continue
+                if data == "Ping":
+                    self.pings += 1
+                    await websocket.send_json({"id": message_id, "data": "Ok"})
+                    continue
+                if isinstance(data, dict) and "Command" in data:
+                    serial, command = data["Command"]
+                    self.commands.append(command)
+                    # Replies are sent concurrently, like the daemon handling
+                    # commands while reading the next message
+                    task = asyncio.create_task(
+                        self._reply_command(websocket, message_id, serial, command)
+                    )
+                    self._reply_tasks.add(task)
+                    task.add_done_callback(self._reply_tasks.discard)
+                    continue
+                await websocket.send_json({"id": message_id, "data": "Ok"})
+        finally:
+            self._websockets.discard(websocket)
+        return websocket
@@ -0,0 +1,165 @@
+"""End-to-end throughput benchmark against a local GoXLR Utility daemon."""
+import asyncio
+from collections.abc import Callable
+from functools import partial
+import statistics
+import time
+import timeit
+from typing import Any
+
+from goxlrutilityapi.const import VOLUME_MAX
+from goxlrutilityapi.models.status import Mixer
+import pytest
+
+from homeassistant.components.goxlr_utility.const import (
+    DEFAULT_WRITE_INTERVALS,
+    DOMAIN,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from . import set_options, setup_integration
+from .fake_utility import (
+    FIXTURE_SERIAL,
+    FakeGoXLRUtility,
+    button_mash,
+    fader_sweep,
+    profile_switch,
+    replace,
+)
+
+LATENCY_SAMPLES = 50
+TIMEOUT = 30
+
+
+def get_entity_id(hass: HomeAssistant, domain: str, key: str) -> str:
+    """Get the entity id for an entity key."""
+    entity_id = er.async_get(hass).async_get_entity_id(
+        domain, DOMAIN, f"{FIXTURE_SERIAL}_{key}"
+    )
+    assert entity_id is not None
+    return entity_id
+
+
+def get_parse_time(mixer: dict[str, Any]) -> float:
+    """Return the best time in seconds to parse the status of a mixer."""
+    return min(timeit.repeat(partial(Mixer.parse_obj, mixer), number=20, repeat=5)) / 20
+
+
+def wait_for_state(
+    hass: HomeAssistant,
+    entity_id: str,
+    predicate: Callable[[Event], bool],
+) -> asyncio.Future[float]:
+    """Return a future resolving to the time a matching state was written."""
+    future: asyncio.Future[float] = hass.loop.create_future()
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if (
+            not future.done()
+            and event.data["entity_id"] == entity_id
+            and predicate(event)
+        ):
+            future.set_result(time.perf_counter())
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    future.add_done_callback(lambda _: unsub())
+    return future
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        pytest.param(fader_sweep(steps=2048), id="fader_sweep"),
+        pytest.param(profile_switch() * 20, id="profile_switch"),
+        pytest.param(button_mash(presses=500), id="button_mash"),
+    ],
+)
+async def test_patch_throughput(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+    scenario: list[list[dict]],
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Measure patches per second and CPU time per patch."""
+    entry = await setup_integration(hass, fake_utility)
+    profile_entity_id = get_entity_id(hass, "sensor", "profile_name")
+    state_writes = 0
+
+    @callback
+    def _count_state_writes(event: Event) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_writes)
+    # Patches are applied in order, so the sentinel marks the end of the run
+    done = wait_for_state(
+        hass,
+        profile_entity_id,
+        lambda event: event.data["new_state"].state == "Benchmark",
+    )
+
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+    patches = await fake_utility.send_patches(
+        [*scenario, [replace("/profile_name", "Benchmark")]]
+    )
+    end_time = await asyncio.wait_for(done, TIMEOUT)
+    cpu = time.process_time() - start_cpu
+    unsub()
+
+    elapsed = end_time - start_time
+    record_property("patches", patches)
+    record_property("patches_per_second", round(patches / elapsed))
+    record_property("cpu_us_per_patch", round(cpu / patches * 1e6, 1))
+    record_property("state_writes", state_writes)
+    state_write_statistics = hass.data[DOMAIN][entry.entry_id].state_write_statistics
+    record_property("state_writes_throttled", state_write_statistics.throttled)
+    record_property("state_writes_skipped", state_write_statistics.skipped)
+
+    # A patch, even with the daemon sending it and the state writes, costs
+    # less than parsing the whole mixer once like a status refresh does
+    mixer = fake_utility.status["mixers"][entry.unique_id]
+    parse_time = get_parse_time(mixer)
+    record_property("status_parse_us", round(parse_time * 1e6, 1))
+    assert cpu / patches < parse_time
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.data.levels.volumes.mic == mixer["levels"]["volumes"]["Mic"]
+    assert coordinator.data.button_down.cough == mixer["button_down"]["Cough"]
+    assert (
+        coordinator.data.lighting.buttons.cough.colours.colour_one
+        == mixer["lighting"]["buttons"]["Cough"]["colours"]["colour_one"]
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_patch_to_state_latency(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Measure the time from a patch being sent to the state being written."""
+    entry = await setup_integration(hass, fake_utility)
+    # Measure the patch pipeline rather than the write interval
+    await set_options(hass, entry, dict.fromkeys(DEFAULT_WRITE_INTERVALS, 0.0))
+    entity_id = get_entity_id(hass, "media_player", "mic")
+
+    latencies: list[float] = []
+    for sample in range(LATENCY_SAMPLES):
+        # Alternate between the extremes so every patch changes the state
+        volume = VOLUME_MAX if sample % 2 == 0 else 0
+        written = wait_for_state(hass, entity_id, lambda event: True)
+        start_time = time.perf_counter()
+        await fake_utility.send_patches([[replace("/levels/volumes/Mic", volume)]])
+        latencies.append((await asyncio.wait_for(written, TIMEOUT)) - start_time)
+
+    quantiles = statistics.quantiles(latencies, n=20)
+    record_property("latency_p50_ms", round(statistics.median(latencies) * 1e3, 2))
+    record_property("latency_p95_ms", round(quantiles[-1] * 1e3, 2))
+    record_property("latency_max_ms", round(max(latencies) * 1e3, 2))
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -1,4 +1,5 @@
 """Test the GoXLR Utility config flow."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from goxlrutilityapi.const import DEFAULT_HOST, DEFAULT_PORT
@@ -7,12 +8,14 @@ from goxlrutilityapi.helpers.tests.models.status import StatusFactory
 from goxlrutilityapi.models.status import Status
 from polyfactory.pytest_plugin import register_fixture
 import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from homeassistant import config_entries
-from homeassistant.components.goxlr_utility.const import DOMAIN
+from homeassistant.components.goxlr_utility.const import DOMAIN, HANDOFF_TIMEOUT
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+import homeassistant.util.dt as dt_util
 
 pytestmark = pytest.mark.usefixtures("mock_setup_entry")
 status_factory_fixture = register_fixture(StatusFactory, name="fixture_status")
@@ -51,6 +54,11 @@ async def test_form(
             },
         )
         await hass.async_block_till_done()
+        # No setup claims the config flow's connection, so it expires
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=HANDOFF_TIMEOUT)
+        )
+        await hass.async_block_till_done()
 
     assert "type" in result2 and result2["type"] == FlowResultType.CREATE_ENTRY
     # assert "title" in result2 and result2["title"] == FIXTURE_NAME
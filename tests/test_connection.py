@@ -0,0 +1,198 @@
+"""Test the GoXLR Utility shared connection."""
+import asyncio
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.components.goxlr_utility.connection import (
+    GoXLRUtilityHandoff,
+    async_claim_handoff,
+)
+from homeassistant.components.goxlr_utility.const import (
+    DATA_CONNECTIONS,
+    DATA_HANDOFFS,
+    DOMAIN,
+    HANDOFF_TIMEOUT,
+    UNAVAILABLE_GRACE_PERIOD,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from . import setup_integration
+from .fake_utility import FIXTURE_SERIAL, FakeGoXLRUtility, build_status, replace
+
+ENTITY_ID = "media_player.tc_helicon_goxlr_microphone"
+SECOND_SERIAL = "S210500002AB"
+
+
+async def test_config_flow_handoff(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test the first setup continues with the config flow's connection."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    assert fake_utility.connections == 1
+    assert coordinator.data.hardware.serial_number == FIXTURE_SERIAL
+    # The status of the config flow and one to resync in the background
+    async with asyncio.timeout(5):
+        while fake_utility.status_requests < 2:
+            await asyncio.sleep(0.01)
+
+    # Patches arrive on the adopted connection
+    await fake_utility.send_patches([[replace("/levels/volumes/Mic", 10)]])
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic != 10:
+            await asyncio.sleep(0.01)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_config_flow_handoff_resynced(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test changes the config flow's listener read are resynced."""
+
+    async def _claim_handoff(*args: Any) -> GoXLRUtilityHandoff | None:
+        """Change the mixer behind the back of the handoff."""
+        handoff = await async_claim_handoff(*args)
+        # Like a patch read by the config flow's listener and lost with it
+        fake_utility.status["mixers"][FIXTURE_SERIAL]["levels"]["volumes"]["Mic"] = 10
+        return handoff
+
+    with patch(
+        "homeassistant.components.goxlr_utility.coordinator.async_claim_handoff",
+        _claim_handoff,
+    ):
+        entry = await setup_integration(hass, fake_utility)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic != 10:
+            await asyncio.sleep(0.01)
+    assert fake_utility.connections == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_mixers_share_connection(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test mixers on one daemon share a connection and get their own patches."""
+    fake_utility.status = build_status(FIXTURE_SERIAL, SECOND_SERIAL)
+
+    first_entry = await setup_integration(hass, fake_utility)
+    second_entry = await setup_integration(hass, fake_utility)
+    assert first_entry.unique_id == FIXTURE_SERIAL
+    assert second_entry.unique_id == SECOND_SERIAL
+
+    # The first entry continues on the connection of its config flow
+    assert fake_utility.connections == 2
+    connections = hass.data[DOMAIN][DATA_CONNECTIONS]
+    assert len(connections) == 1
+    connection = next(iter(connections.values()))
+    assert set(connection.coordinators) == {FIXTURE_SERIAL, SECOND_SERIAL}
+
+    first = hass.data[DOMAIN][first_entry.entry_id]
+    second = hass.data[DOMAIN][second_entry.entry_id]
+    await fake_utility.send_patches(
+        [[replace("/levels/volumes/Mic", 10, SECOND_SERIAL)]]
+    )
+    async with asyncio.timeout(5):
+        while second.data.levels.volumes.mic != 10:
+            await asyncio.sleep(0.01)
+    assert first.data.levels.volumes.mic != 10
+
+    # The first entry keeps the connection up for the second one
+    assert await hass.config_entries.async_unload(first_entry.entry_id)
+    assert connection.connected
+    assert set(connection.coordinators) == {SECOND_SERIAL}
+
+    assert await hass.config_entries.async_unload(second_entry.entry_id)
+    assert second_entry.state is ConfigEntryState.NOT_LOADED
+    assert not connection.connected
+    assert not connections
+
+
+async def test_reconnect(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test the connection is restored and the mixer resynced after an outage."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    with patch(
+        "homeassistant.components.goxlr_utility.connection.RECONNECT_BASE_DELAY",
+        0.05,
+    ):
+        await fake_utility.stop()
+        async with asyncio.timeout(5):
+            while coordinator.connection.connected:
+                await asyncio.sleep(0.01)
+
+        # Entities stay available for a short outage
+        await hass.async_block_till_done()
+        assert coordinator.last_update_success
+        state = hass.states.get(ENTITY_ID)
+        assert state is not None
+        assert state.state != STATE_UNAVAILABLE
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=UNAVAILABLE_GRACE_PERIOD)
+        )
+        async with asyncio.timeout(5):
+            while (state := hass.states.get(ENTITY_ID)) is None or (
+                state.state != STATE_UNAVAILABLE
+            ):
+                await asyncio.sleep(0.01)
+
+        # A change made while disconnected is picked up by the resync
+        fake_utility.status["mixers"][FIXTURE_SERIAL]["levels"]["volumes"]["Mic"] = 0
+        await fake_utility.start()
+        async with asyncio.timeout(5):
+            while not coordinator.reconnect_statistics.reconnects:
+                await asyncio.sleep(0.01)
+
+    statistics = coordinator.reconnect_statistics
+    assert statistics.reconnects == 1
+    assert statistics.attempts == statistics.last_attempts > 1
+    assert statistics.last_recovery_time is not None
+    assert coordinator.connection.connected
+    assert coordinator.data.levels.volumes.mic == 0
+
+    # The resynced state may be held back until the write interval ends
+    async with asyncio.timeout(5):
+        while (state := hass.states.get(ENTITY_ID)) is None or (
+            state.state == STATE_UNAVAILABLE
+        ):
+            await asyncio.sleep(0.01)
+    assert state.attributes["volume_level"] == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unclaimed_handoff_expires(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test the config flow's connection is closed if no setup claims it."""
+    await setup_integration(hass, fake_utility)
+    assert len(mock_setup_entry.mock_calls) == 1
+    handoffs = hass.data[DOMAIN][DATA_HANDOFFS]
+    handoff = handoffs[FIXTURE_SERIAL]
+    assert handoff.client.connected
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=HANDOFF_TIMEOUT))
+    await hass.async_block_till_done()
+
+    assert not handoffs
+    assert not handoff.client.connected
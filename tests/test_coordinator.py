@@ -0,0 +1,476 @@
+"""Test the GoXLR Utility coordinator."""
+import asyncio
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.goxlr_utility.const import (
+    ATTR_STALE,
+    CONF_LATENCY_PROBE,
+    CONF_OPTIMISTIC,
+    CONF_PATCH_BATCH_WINDOW,
+    CONF_PATCH_OVERFLOW_POLICY,
+    DOMAIN,
+    PATCH_OVERFLOW_BLOCK,
+)
+from homeassistant.components.goxlr_utility.client import GoXLRUtilityClient
+from homeassistant.components.goxlr_utility.coordinator import (
+    GoXLRUtilityDataUpdateCoordinator,
+)
+from homeassistant.components.goxlr_utility.helper import diff_models, setup_connection
+from homeassistant.components.light import (
+    ATTR_RGB_COLOR,
+    DOMAIN as LIGHT_DOMAIN,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_STOP,
+    SERVICE_TURN_ON,
+)
+from homeassistant.core import HomeAssistant
+
+from . import set_options, setup_integration, wait_for_commands
+from .fake_utility import FIXTURE_SERIAL, FakeGoXLRUtility, replace
+
+
+async def test_commands_coalesced(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test only the latest values of a target are sent."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    for volume in range(10):
+        coordinator.async_set_volume("Mic", volume)
+    coordinator.async_set_button_colours("cough", colour_one="FF0000")
+    coordinator.async_set_button_colours("cough", colour_two="00FF00")
+    await wait_for_commands(fake_utility, 2)
+    await hass.async_block_till_done()
+
+    assert fake_utility.commands == [
+        {"SetVolume": ["Mic", 9]},
+        {"SetButtonColours": ["Cough", "FF0000", "00FF00"]},
+    ]
+    assert coordinator.command_statistics.scheduled == 12
+    assert coordinator.command_statistics.coalesced == 10
+    assert coordinator.command_statistics.sent == 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_optimistic_value_confirmed(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test a value is shown before the device confirms it."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    coordinator.async_set_volume("Mic", 0)
+    state = hass.states.get("media_player.tc_helicon_goxlr_microphone")
+    assert state is not None
+    assert state.attributes["volume_level"] == 0
+
+    async with asyncio.timeout(5):
+        while not coordinator.command_statistics.confirmed:
+            await asyncio.sleep(0.01)
+    assert coordinator.data.levels.volumes.mic == 0
+    assert coordinator.command_statistics.rolled_back == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_optimistic_colour_confirmed(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test a colour set from a light is confirmed by its echo."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: "light.tc_helicon_goxlr_cough_active",
+            ATTR_RGB_COLOR: [255, 0, 0],
+        },
+        blocking=True,
+    )
+    await wait_for_commands(fake_utility, 1)
+    assert fake_utility.commands == [
+        {"SetButtonColours": ["Cough", "FF0000", "000000"]}
+    ]
+
+    async with asyncio.timeout(5):
+        while not coordinator.command_statistics.confirmed:
+            await asyncio.sleep(0.01)
+    assert coordinator.command_statistics.rolled_back == 0
+    assert coordinator.round_trip_metrics.command_echo_time.count == 1
+    assert coordinator.data.lighting.buttons.cough.colours.colour_one == "FF0000"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_optimistic_value_rolled_back(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test a value the device does not confirm is rolled back."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fake_utility.echo_commands = False
+
+    with patch(
+        "homeassistant.components.goxlr_utility.coordinator.OPTIMISTIC_TIMEOUT",
+        0.05,
+    ):
+        coordinator.async_set_button_colours("cough", colour_one="ff0000")
+    assert coordinator.data.lighting.buttons.cough.colours.colour_one == "FF0000"
+
+    async with asyncio.timeout(5):
+        while not coordinator.command_statistics.rolled_back:
+            await asyncio.sleep(0.01)
+    assert coordinator.data.lighting.buttons.cough.colours.colour_one == "00FFFF"
+    state = hass.states.get("light.tc_helicon_goxlr_cough_active")
+    assert state is not None
+    assert state.attributes["rgb_color"] == (0, 255, 255)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_optimistic_value_missing_subtree(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test values under a subtree the mixer does not report are still sent."""
+    fake_utility.status["mixers"][FIXTURE_SERIAL]["router"]["Samples"] = None
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.data.router.samples is None
+    fake_utility.echo_commands = False
+
+    coordinator.async_set_route("samples", "headphones", False)
+    assert coordinator.data.router.samples is None
+    await wait_for_commands(fake_utility, 1)
+
+    assert fake_utility.commands == [{"SetRouter": ["Samples", "Headphones", False]}]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_optimistic_value_subtree_removed(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test rolling back a value whose subtree the mixer stopped reporting."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fake_utility.echo_commands = False
+
+    with patch(
+        "homeassistant.components.goxlr_utility.coordinator.OPTIMISTIC_TIMEOUT",
+        0.05,
+    ):
+        coordinator.async_set_fader_colours("a", colour_one="FF0000")
+    await fake_utility.send_patches([[replace("/lighting/faders/A/colours", None)]])
+
+    async with asyncio.timeout(5):
+        while not coordinator.command_statistics.rolled_back:
+            await asyncio.sleep(0.01)
+    assert coordinator.data.lighting.faders.a.colours is None
+    assert "Error applying patches" not in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_pipeline_options(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test values wait for the device with optimistic values turned off."""
+    entry = await setup_integration(hass, fake_utility)
+    await set_options(
+        hass,
+        entry,
+        {
+            CONF_OPTIMISTIC: False,
+            CONF_PATCH_BATCH_WINDOW: 0,
+            CONF_PATCH_OVERFLOW_POLICY: PATCH_OVERFLOW_BLOCK,
+        },
+    )
+    assert entry.options[CONF_PATCH_BATCH_WINDOW] == 0
+    assert entry.options[CONF_PATCH_OVERFLOW_POLICY] == PATCH_OVERFLOW_BLOCK
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    coordinator.async_set_volume("Mic", 0)
+    assert coordinator.data.levels.volumes.mic == 191
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic != 0:
+            await asyncio.sleep(0.01)
+    assert coordinator.command_statistics.confirmed == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_commands_pipelined(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test commands for different targets are in flight together."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    fake_utility.reply_delay = 0.2
+    channels = ("Mic", "LineIn", "Console", "System", "Game", "Chat", "Music")
+
+    started = time.perf_counter()
+    for channel in channels:
+        coordinator.async_set_volume(channel, 0)
+    await hass.async_block_till_done()
+    assert coordinator.client is not None
+    assert coordinator.client.commands_in_flight == len(channels)
+
+    async with asyncio.timeout(5):
+        while coordinator.command_statistics.sent < len(channels):
+            await asyncio.sleep(0.01)
+    # One reply delay for all commands instead of one per command
+    assert time.perf_counter() - started < 0.2 * len(channels) / 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_commands_dropped_while_disconnected(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test commands issued before the daemon is connected are rolled back."""
+    entry = await setup_integration(hass, fake_utility)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await fake_utility.stop()
+    release = asyncio.Event()
+
+    async def _setup_connection(*args: Any) -> GoXLRUtilityClient:
+        """Hold connect attempts until released."""
+        await release.wait()
+        return await setup_connection(*args)
+
+    with patch(
+        "homeassistant.components.goxlr_utility.connection.setup_connection",
+        _setup_connection,
+    ):
+        # The last known mixer is shown while there is no client yet
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][
+            entry.entry_id
+        ]
+        assert coordinator.client is None
+
+        coordinator.async_set_volume("Mic", 0)
+        assert coordinator.data.levels.volumes.mic == 0
+        async with asyncio.timeout(5):
+            while not coordinator.command_statistics.failed:
+                await asyncio.sleep(0.01)
+        assert coordinator.command_statistics.sent == 0
+        # The value that was never sent is not shown until the timeout
+        assert coordinator.command_statistics.rolled_back == 1
+        assert coordinator.data.levels.volumes.mic == 191
+        async with asyncio.timeout(5):
+            while (
+                state := hass.states.get("media_player.tc_helicon_goxlr_microphone")
+            ) is None or not state.attributes["volume_level"]:
+                await asyncio.sleep(0.01)
+
+        await fake_utility.start()
+        release.set()
+        async with asyncio.timeout(5):
+            while coordinator.stale:
+                await asyncio.sleep(0.01)
+
+    assert fake_utility.commands == []
+    assert coordinator.command_statistics.failed == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_round_trips_measured(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test pings back off while idle and commands are timed until their echo."""
+    entry = await setup_integration(hass, fake_utility)
+
+    with patch(
+        "homeassistant.components.goxlr_utility.coordinator.LATENCY_PROBE_INTERVAL",
+        0.02,
+    ), patch(
+        "homeassistant.components.goxlr_utility.coordinator.LATENCY_PROBE_MAX_INTERVAL",
+        0.08,
+    ):
+        await set_options(hass, entry, {CONF_LATENCY_PROBE: True})
+        coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][
+            entry.entry_id
+        ]
+        metrics = coordinator.round_trip_metrics
+
+        async with asyncio.timeout(5):
+            while fake_utility.pings < 4:
+                await asyncio.sleep(0.01)
+        assert metrics.probe_time.count == metrics.probes >= 3
+        assert metrics.failed_probes == 0
+        assert metrics.probe_interval == 0.08
+
+        # Activity brings the interval back down, right away unless a ping
+        # is in flight
+        coordinator.async_set_volume("Mic", 10)
+        async with asyncio.timeout(5):
+            while not metrics.command_echo_time.count or metrics.probe_interval != 0.02:
+                await asyncio.sleep(0.01)
+        assert metrics.command_echo_time.percentile(50) is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unmodelled_patches_skipped(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test patches into subtrees without a model do not stop later patches."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    await fake_utility.send_patches(
+        [
+            [
+                replace(
+                    "/lighting/sampler/SamplerSelectA",
+                    {"off_style": "Dimmed", "colours": {"colour_one": "FF0000"}},
+                ),
+                replace("/effects/is_enabled", True),
+            ],
+            [replace("/levels/volumes/Mic", 10)],
+        ]
+    )
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic != 10:
+            await asyncio.sleep(0.01)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_patches_share_unchanged_subtrees(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test patches produce new data sharing every untouched subtree."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    old_data = coordinator.data
+    old_volume = old_data.levels.volumes.mic
+
+    await fake_utility.send_patches([[replace("/levels/volumes/Mic", 10)]])
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic != 10:
+            await asyncio.sleep(0.01)
+
+    new_data = coordinator.data
+    assert new_data is not old_data
+    assert old_data.levels.volumes.mic == old_volume
+    assert new_data.levels is not old_data.levels
+    assert new_data.levels.volumes is not old_data.levels.volumes
+    assert new_data.levels.bleep is old_data.levels.bleep
+    assert new_data.lighting is old_data.lighting
+    assert new_data.button_down is old_data.button_down
+    assert diff_models(old_data, new_data) == [(("levels", "volumes", "mic"), 10)]
+
+    # A patch setting the value already held leaves the data as it is
+    await fake_utility.send_patches(
+        [
+            [replace("/levels/volumes/Mic", 10)],
+            [replace("/profile_name", "Patched")],
+        ]
+    )
+    async with asyncio.timeout(5):
+        while coordinator.data.profile_name != "Patched":
+            await asyncio.sleep(0.01)
+    assert coordinator.data.levels is new_data.levels
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_snapshot_warm_start(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test the last known mixer is shown until the daemon is connected."""
+    entry = await setup_integration(hass, fake_utility)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    snapshot = hass_storage[f"{DOMAIN}.{entry.entry_id}"]["data"]
+    assert snapshot["hardware"]["serial_number"] == FIXTURE_SERIAL
+
+    await fake_utility.stop()
+    connecting = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _setup_connection(*args: Any) -> GoXLRUtilityClient:
+        """Hold connect attempts until released."""
+        connecting.set()
+        await release.wait()
+        return await setup_connection(*args)
+
+    with patch(
+        "homeassistant.components.goxlr_utility.connection.RECONNECT_BASE_DELAY",
+        0.05,
+    ), patch(
+        "homeassistant.components.goxlr_utility.connection.setup_connection",
+        _setup_connection,
+    ):
+        # Setup does not wait for connecting
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert entry.state is ConfigEntryState.LOADED
+        assert connecting.is_set()
+        coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][
+            entry.entry_id
+        ]
+        assert coordinator.stale
+        state = hass.states.get("media_player.tc_helicon_goxlr_microphone")
+        assert state is not None
+        assert state.attributes[ATTR_STALE]
+
+        await fake_utility.start()
+        release.set()
+        async with asyncio.timeout(5):
+            while coordinator.stale:
+                await asyncio.sleep(0.01)
+
+    await hass.async_block_till_done()
+    state = hass.states.get("media_player.tc_helicon_goxlr_microphone")
+    assert state is not None
+    assert ATTR_STALE not in state.attributes
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_stop_listener_removed(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test unloading removes the listener cleaning up on shutdown."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.unsub is not None
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert coordinator.unsub is None
+
+    with patch.object(coordinator, "cleanup") as mock_cleanup:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+    mock_cleanup.assert_not_called()
@@ -0,0 +1,42 @@
+"""Test the GoXLR Utility diagnostics."""
+import asyncio
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.components.goxlr_utility.const import DOMAIN, RECENT_PATCHES_SIZE
+from homeassistant.components.goxlr_utility.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from homeassistant.core import HomeAssistant
+
+from . import setup_integration
+from .fake_utility import FIXTURE_SERIAL, FakeGoXLRUtility, fader_sweep
+
+
+async def test_diagnostics(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test diagnostics are redacted and keep only the recent patches."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    patches = await fake_utility.send_patches(
+        fader_sweep(steps=RECENT_PATCHES_SIZE * 2)
+    )
+    async with asyncio.timeout(5):
+        while coordinator.batch_statistics.patches < patches:
+            await asyncio.sleep(0.01)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"]["host"] == REDACTED
+    assert diagnostics["mixer"]["hardware"]["serial_number"] == REDACTED
+    assert FIXTURE_SERIAL not in str(diagnostics)
+    assert fake_utility.host not in str(diagnostics)
+    assert diagnostics["connection"]["connected"]
+    assert patches > RECENT_PATCHES_SIZE
+    assert len(diagnostics["recent_patches"]) == RECENT_PATCHES_SIZE
+    # The paths leave out the serial number of the mixer
+    assert diagnostics["recent_patches"][-1]["path"] == "/levels/volumes/Mic"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,156 @@
+"""Test the GoXLR Utility entities."""
+import asyncio
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.components.goxlr_utility.const import (
+    CONF_BINARY_SENSOR_WRITE_INTERVAL,
+    CONF_BUTTON_LIGHTS,
+    CONF_BUTTON_SENSORS,
+    CONF_DIAGNOSTICS,
+    CONF_FADER_LIGHTS,
+    DOMAIN,
+)
+from homeassistant.components.goxlr_utility.coordinator import (
+    GoXLRUtilityDataUpdateCoordinator,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_OFF, STATE_ON
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+
+from . import set_options, setup_integration
+from .fake_utility import FakeGoXLRUtility, button_mash, replace
+
+ENTITY_ID = "binary_sensor.tc_helicon_goxlr_cough_pressed"
+# Longer than the test takes, so only firing the time changed ends an interval
+WRITE_INTERVAL = 5.0
+
+
+async def test_state_writes_throttled(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test state writes are throttled and the last state is still written."""
+    entry = await setup_integration(hass, fake_utility)
+    await set_options(hass, entry, {CONF_BINARY_SENSOR_WRITE_INTERVAL: WRITE_INTERVAL})
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert entry.options[CONF_BINARY_SENSOR_WRITE_INTERVAL] == WRITE_INTERVAL
+    writes: list[str] = []
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if event.data["entity_id"] == ENTITY_ID:
+            writes.append(event.data["new_state"].state)
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+
+    # Reconnecting after the options reload writes the state, so the press
+    # may be held back until that interval ends
+    await fake_utility.send_patches([[replace("/button_down/Cough", True)]])
+    async with asyncio.timeout(5):
+        while not coordinator.data.button_down.cough:
+            await asyncio.sleep(0.01)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=WRITE_INTERVAL))
+    await hass.async_block_till_done()
+    assert writes == [STATE_ON]
+
+    # Presses inside the interval are held back, the volume patch marks the end
+    await fake_utility.send_patches(
+        [*button_mash(presses=50), [replace("/levels/volumes/Mic", 0)]]
+    )
+    async with asyncio.timeout(5):
+        while coordinator.data.levels.volumes.mic:
+            await asyncio.sleep(0.01)
+    assert not coordinator.data.button_down.cough
+    await hass.async_block_till_done()
+    assert writes == [STATE_ON]
+    assert coordinator.state_write_statistics.throttled > 0
+
+    # The end of the interval writes the released state once
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=WRITE_INTERVAL))
+    await hass.async_block_till_done()
+    unsub()
+
+    assert writes == [STATE_ON, STATE_OFF]
+    assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unchanged_state_not_written(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test patches that do not change what an entity shows are not written."""
+    entry = await setup_integration(hass, fake_utility)
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    statistics = coordinator.state_write_statistics
+    written = statistics.written
+
+    # The same colour in lower case updates the lights of the button
+    await fake_utility.send_patches(
+        [[replace("/lighting/buttons/Cough/colours/colour_one", "00ffff")]]
+    )
+    async with asyncio.timeout(5):
+        while statistics.skipped < 2:
+            await asyncio.sleep(0.01)
+    assert statistics.written == written
+
+    await fake_utility.send_patches(
+        [[replace("/lighting/buttons/Cough/colours/colour_one", "ff0000")]]
+    )
+    async with asyncio.timeout(5):
+        while statistics.written == written:
+            await asyncio.sleep(0.01)
+    state = hass.states.get("light.tc_helicon_goxlr_cough_active")
+    assert state is not None
+    assert state.attributes["rgb_color"] == (255, 0, 0)
+    assert statistics.skipped == 3
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_entity_groups_turned_off(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test entity groups turned off are not created or subscribed."""
+    entry = await setup_integration(hass, fake_utility)
+    entity_registry = er.async_get(hass)
+    assert hass.states.async_entity_ids("light")
+    assert hass.states.async_entity_ids("binary_sensor")
+
+    await set_options(
+        hass,
+        entry,
+        {
+            CONF_BUTTON_LIGHTS: False,
+            CONF_FADER_LIGHTS: False,
+            CONF_BUTTON_SENSORS: False,
+            CONF_DIAGNOSTICS: False,
+        },
+    )
+    coordinator: GoXLRUtilityDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entity_entries = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+    assert {entity_entry.domain for entity_entry in entity_entries} == {
+        "media_player",
+        "sensor",
+    }
+    assert not any(
+        entity_entry.unique_id.endswith("_patch_rate")
+        for entity_entry in entity_entries
+    )
+    assert not hass.states.async_entity_ids("light")
+    assert not hass.states.async_entity_ids("binary_sensor")
+    assert hass.states.get("media_player.tc_helicon_goxlr_microphone") is not None
+    assert not any(path[0] == "button_down" for path in coordinator._path_listeners)
+
+    # Turning a group back on creates its entities again
+    await set_options(hass, entry, {CONF_BUTTON_SENSORS: True})
+    assert hass.states.get(ENTITY_ID) is not None
+    assert not hass.states.async_entity_ids("light")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
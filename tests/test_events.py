@@ -0,0 +1,90 @@
+"""Test the GoXLR Utility button press events."""
+import asyncio
+from unittest.mock import patch
+
+from homeassistant.components.goxlr_utility.const import (
+    ATTR_BUTTON,
+    ATTR_TYPE,
+    DOMAIN,
+    EVENT_BUTTON,
+    PRESS_TYPE_DOUBLE,
+    PRESS_TYPE_INITIAL,
+    PRESS_TYPE_LONG,
+    PRESS_TYPE_SINGLE,
+)
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from . import setup_integration
+from .fake_utility import FIXTURE_SERIAL, FakeGoXLRUtility, replace
+
+DOUBLE_PRESS_WINDOW = 0.1
+LONG_PRESS_TIME = 0.2
+
+
+async def wait_for_events(events: list[Event], count: int) -> None:
+    """Wait for a number of events to be fired."""
+    async with asyncio.timeout(5):
+        while len(events) < count:
+            await asyncio.sleep(0.01)
+
+
+async def test_button_press_events(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test button presses are classified into single, double and long presses."""
+    entry = await setup_integration(hass, fake_utility)
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+    events: list[Event] = []
+
+    @callback
+    def _button_pressed(event: Event) -> None:
+        events.append(event)
+
+    unsub = hass.bus.async_listen(EVENT_BUTTON, _button_pressed)
+    press = [replace("/button_down/Cough", True)]
+    release = [replace("/button_down/Cough", False)]
+
+    with patch(
+        "homeassistant.components.goxlr_utility.events.DOUBLE_PRESS_WINDOW",
+        DOUBLE_PRESS_WINDOW,
+    ), patch(
+        "homeassistant.components.goxlr_utility.events.LONG_PRESS_TIME",
+        LONG_PRESS_TIME,
+    ):
+        await fake_utility.send_patches([press, release])
+        await wait_for_events(events, 2)
+        assert events[0].data == {
+            ATTR_DEVICE_ID: device.id,
+            ATTR_BUTTON: "cough",
+            ATTR_TYPE: PRESS_TYPE_INITIAL,
+        }
+        assert events[1].data[ATTR_TYPE] == PRESS_TYPE_SINGLE
+
+        events.clear()
+        await fake_utility.send_patches([press, release, press, release])
+        await wait_for_events(events, 3)
+        await asyncio.sleep(DOUBLE_PRESS_WINDOW * 2)
+        assert [event.data[ATTR_TYPE] for event in events] == [
+            PRESS_TYPE_INITIAL,
+            PRESS_TYPE_INITIAL,
+            PRESS_TYPE_DOUBLE,
+        ]
+
+        # A long press is reported while the button is still held
+        events.clear()
+        await fake_utility.send_patches([press])
+        await wait_for_events(events, 2)
+        assert [event.data[ATTR_TYPE] for event in events] == [
+            PRESS_TYPE_INITIAL,
+            PRESS_TYPE_LONG,
+        ]
+        await fake_utility.send_patches([release])
+        await asyncio.sleep(DOUBLE_PRESS_WINDOW * 2)
+        assert len(events) == 2
+
+    unsub()
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,63 @@
+"""Test the GoXLR Utility import cost."""
+from collections.abc import Callable
+import subprocess
+import sys
+
+INTEGRATION = "homeassistant.components.goxlr_utility"
+
+# Imported by Home Assistant before any integration is loaded
+PRELOAD = "import homeassistant.core, homeassistant.config_entries"
+
+# Only needed once a platform is set up
+DEFERRED_MODULES = (
+    f"{INTEGRATION}.binary_sensor",
+    f"{INTEGRATION}.entity",
+    f"{INTEGRATION}.light",
+    f"{INTEGRATION}.media_player",
+    f"{INTEGRATION}.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.light",
+    "homeassistant.components.media_player",
+    "homeassistant.components.sensor",
+    "homeassistant.util.color",
+)
+
+
+def get_import_times(code: str) -> dict[str, int]:
+    """Get the cumulative import time in microseconds of every imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{PRELOAD}; {code}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split(":", 1)[1].split("|")
+        if cumulative.strip().isdigit():
+            import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_import_defers_platforms(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Test importing the integration does not import its platforms."""
+    import_times = get_import_times(f"import {INTEGRATION}")
+
+    assert INTEGRATION in import_times
+    assert not [module for module in DEFERRED_MODULES if module in import_times]
+
+    record_property("import_ms", import_times[INTEGRATION] / 1000)
+
+
+def test_import_defers_light_descriptions() -> None:
+    """Test the light descriptions are built when the platform is set up."""
+    import_times = get_import_times(
+        f"from {INTEGRATION}.light import get_light_descriptions; "
+        "assert get_light_descriptions.cache_info().currsize == 0"
+    )
+
+    assert f"{INTEGRATION}.light" in import_times
@@ -0,0 +1,56 @@
+"""Test the GoXLR Utility metrics."""
+import math
+from unittest.mock import patch
+
+from homeassistant.components.goxlr_utility.metrics import Histogram, RateCounter
+
+
+def test_histogram() -> None:
+    """Test values are counted in the bucket of their upper bound."""
+    histogram = Histogram((1.0, 5.0, 10.0))
+    assert histogram.mean is None
+    assert histogram.percentile(50) is None
+
+    for value in (0.5, 1.0, 3.0, 4.0, 10.0):
+        histogram.record(value)
+
+    assert histogram.count == 5
+    assert histogram.mean == 3.7
+    assert histogram.buckets == {"1.0": 2, "5.0": 2, "10.0": 1, "inf": 0}
+    assert histogram.percentile(40) == 1.0
+    assert histogram.percentile(50) == 5.0
+    assert histogram.percentile(100) == 10.0
+
+
+def test_histogram_overflow() -> None:
+    """Test percentiles above the last bound are not reported as the bound."""
+    histogram = Histogram((1.0, 5.0))
+    for value in (0.5, 50.0, 500.0):
+        histogram.record(value)
+
+    assert histogram.buckets == {"1.0": 1, "5.0": 0, "inf": 2}
+    assert histogram.percentile(30) == 1.0
+    assert histogram.percentile(50) == math.inf
+    assert histogram.percentile(99) == math.inf
+
+
+def test_rate_counter() -> None:
+    """Test the rate only counts events inside the window."""
+    with patch("homeassistant.components.goxlr_utility.metrics.time") as mock_time:
+        rate_counter = RateCounter(window=4)
+        mock_time.monotonic.return_value = 100.0
+        assert rate_counter.rate == 0
+
+        rate_counter.record()
+        rate_counter.record(3)
+        mock_time.monotonic.return_value = 101.5
+        rate_counter.record(4)
+        assert rate_counter.rate == 2
+
+        # The slot of a second is reused once the window has passed it
+        mock_time.monotonic.return_value = 104.2
+        rate_counter.record(2)
+        assert rate_counter.rate == 1.5
+
+        mock_time.monotonic.return_value = 110.0
+        assert rate_counter.rate == 0
@@ -0,0 +1,206 @@
+"""Test the GoXLR Utility services."""
+import asyncio
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.components.goxlr_utility.const import (
+    ATTR_ACCENT,
+    ATTR_BUTTONS,
+    ATTR_FADERS,
+    ATTR_ROUTES,
+    DOMAIN,
+    SERVICE_SET_LIGHTING,
+    SERVICE_SET_ROUTING,
+)
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+
+from . import setup_integration, wait_for_commands
+from .fake_utility import FIXTURE_SERIAL, FakeGoXLRUtility, replace
+
+ROUTING_ENTITY_ID = "sensor.tc_helicon_goxlr_routing"
+# Eight inputs by five outputs, all routed
+ALL_ROUTES = (1 << 40) - 1
+
+
+async def test_set_lighting(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test colour pairs are merged and unchanged targets are skipped."""
+    entry = await setup_integration(hass, fake_utility)
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_LIGHTING,
+        {
+            ATTR_DEVICE_ID: device.id,
+            ATTR_ACCENT: [0, 255, 255],
+            ATTR_BUTTONS: {
+                "cough": {"active": [255, 0, 0], "inactive": [32, 0, 0]},
+                "bleep": {"active": [0, 255, 255], "inactive": [0, 0, 0]},
+            },
+            ATTR_FADERS: {"a": {"top": [255, 0, 0]}},
+        },
+        blocking=True,
+    )
+    await wait_for_commands(fake_utility, 2)
+    await hass.async_block_till_done()
+
+    assert fake_utility.commands == [
+        {"SetButtonColours": ["Cough", "FF0000", "200000"]},
+        {"SetFaderColours": ["A", "FF0000", "FF00FF"]},
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_lighting_missing_colours(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test colours the mixer does not report are set."""
+    lighting = fake_utility.status["mixers"][FIXTURE_SERIAL]["lighting"]
+    lighting["simple"]["Accent"]["colour_one"] = None
+    lighting["buttons"]["Cough"]["colours"]["colour_two"] = None
+    entry = await setup_integration(hass, fake_utility)
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_LIGHTING,
+        {
+            ATTR_DEVICE_ID: device.id,
+            ATTR_ACCENT: [0, 255, 255],
+            ATTR_BUTTONS: {"cough": {"inactive": [32, 0, 0]}},
+        },
+        blocking=True,
+    )
+    await wait_for_commands(fake_utility, 2)
+    await hass.async_block_till_done()
+
+    assert fake_utility.commands == [
+        {"SetSimpleColour": ["Accent", "00FFFF"]},
+        {"SetButtonColours": ["Cough", "00FFFF", "200000"]},
+    ]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_lighting_missing_fader_colours(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test fader colours are set when the mixer does not report them."""
+    lighting = fake_utility.status["mixers"][FIXTURE_SERIAL]["lighting"]
+    lighting["faders"]["A"]["colours"] = None
+    fake_utility.echo_commands = False
+    entry = await setup_integration(hass, fake_utility)
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_LIGHTING,
+        {
+            ATTR_DEVICE_ID: device.id,
+            ATTR_FADERS: {"a": {"top": [255, 0, 0]}},
+        },
+        blocking=True,
+    )
+    await wait_for_commands(fake_utility, 1)
+    await hass.async_block_till_done()
+
+    assert fake_utility.commands == [{"SetFaderColours": ["A", "FF0000", None]}]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_lighting_invalid(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test unknown devices and targets are rejected."""
+    entry = await setup_integration(hass, fake_utility)
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_LIGHTING,
+            {ATTR_DEVICE_ID: "unknown", ATTR_ACCENT: [255, 0, 0]},
+            blocking=True,
+        )
+
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_LIGHTING,
+            {ATTR_DEVICE_ID: device.id, ATTR_BUTTONS: {"unknown": {}}},
+            blocking=True,
+        )
+
+    assert not fake_utility.commands
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_routing(
+    hass: HomeAssistant,
+    fake_utility: FakeGoXLRUtility,
+) -> None:
+    """Test routing patches flip bits and only changed routes are sent."""
+    entry = await setup_integration(hass, fake_utility)
+    device = dr.async_get(hass).async_get_device({(DOMAIN, FIXTURE_SERIAL)})
+    assert device is not None
+    state = hass.states.get(ROUTING_ENTITY_ID)
+    assert state is not None
+    assert int(state.state) == ALL_ROUTES
+    assert state.attributes["inputs"][1] == "chat"
+    assert state.attributes["outputs"][4] == "line_out"
+
+    # Chat is the second input, line out the fifth output
+    await fake_utility.send_patches([[replace("/router/Chat/LineOut", False)]])
+    async with asyncio.timeout(5):
+        while int(hass.states.get(ROUTING_ENTITY_ID).state) == ALL_ROUTES:
+            await asyncio.sleep(0.01)
+    assert int(hass.states.get(ROUTING_ENTITY_ID).state) == ALL_ROUTES & ~(1 << 9)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ROUTING,
+        {
+            ATTR_DEVICE_ID: device.id,
+            ATTR_ROUTES: {
+                "microphone": {"headphones": False, "line_out": True},
+                "chat": {"line_out": True},
+            },
+        },
+        blocking=True,
+    )
+    await wait_for_commands(fake_utility, 2)
+    await hass.async_block_till_done()
+
+    assert fake_utility.commands == [
+        {"SetRouter": ["Microphone", "Headphones", False]},
+        {"SetRouter": ["Chat", "LineOut", True]},
+    ]
+    # The expected routes are shown right away
+    assert int(hass.states.get(ROUTING_ENTITY_ID).state) == ALL_ROUTES & ~1
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_ROUTING,
+            {ATTR_DEVICE_ID: device.id, ATTR_ROUTES: {"chat": {"unknown": True}}},
+            blocking=True,
+        )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)